@@ -1,4 +1,5 @@
 from .widget import Widget
 from .text import Text
 from .button import Button
-from .text_button import TextButton
\ No newline at end of file
+from .text_button import TextButton
+from .button_group import ButtonGroup
\ No newline at end of file
@@ -5,10 +5,12 @@ Use `~pgm.gui.Button` instead of `~pgm.gui.button.Button`
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Final
+from weakref import WeakKeyDictionary
 
 from pyglet.gui import PushButton as _PushButton
 
+from ..types import ButtonStatus
 from .widget import Widget
 
 if TYPE_CHECKING:
@@ -16,8 +18,24 @@ if TYPE_CHECKING:
 	from pyglet.image import AbstractImage
 
 	from ..sprite import SpriteSheet
-	from ..types import Anchor, AnchorX, AnchorY, ButtonStatus, EventHandler, Point2D
+	from ..types import Anchor, AnchorX, AnchorY, EventHandler, Point2D
 	from ..window import Window
+	from .button_group import ButtonGroup
+
+_PUSH_HANDLERS: Final[dict[str, Callable[..., None]]] = {
+	'on_mouse_press': _PushButton.on_mouse_press,
+	'on_mouse_motion': _PushButton.on_mouse_motion,
+	'on_mouse_release': _PushButton.on_mouse_release,
+	'on_mouse_drag': _PushButton.on_mouse_drag,
+}
+"""Parent handler of each mouse event"""
+_HIT_STATUS: Final[dict[str, ButtonStatus | None]] = {
+	'on_mouse_press': ButtonStatus.PRESSED,
+	'on_mouse_motion': ButtonStatus.HOVER,
+	'on_mouse_release': None,
+	'on_mouse_drag': ButtonStatus.HOVER,
+}
+"""Status that stops each mouse event from propagating (None to never stop)"""
 
 
 class Button(_PushButton, Widget):
@@ -27,7 +45,7 @@ class Button(_PushButton, Widget):
 	- `AnchorX`: 'left', 'center', 'right'
 	- `AnchorY`: 'bottom', 'center', 'top'
 
-	Button has three statuses: 'unpressed', 'hover', and 'pressed'.
+	Button has three statuses (see `~pgm.types.ButtonStatus`): unpressed, hover, and pressed.
 
 	Takes a sprite sheet (using `sprite.Spritesheet`) to render the button.
 	Sprite sheet must have images in a row for all of the statuses in above order.
@@ -50,11 +68,28 @@ class Button(_PushButton, Widget):
 	"""Image of pressed button"""
 	ID: str
 	"""Identifier of button"""
-	status: ButtonStatus
-	"""Status of button"""
-
 	_last_mouse_pos: tuple[int, int] = 0, 0
 	"""Holds the last mouse position registered by button"""
+	_hit_group: ButtonGroup | None = None
+	"""Group handling mouse events of button, if any"""
+	_status: ButtonStatus = ButtonStatus.UNPRESSED
+	"""Status of button (`.status` without conversion)"""
+	_ax: float = 0
+	"""x of `._anchor`, stored separately for position accessors"""
+	_ay: float = 0
+	"""y of `._anchor`, stored separately for position accessors"""
+
+	_sheet_images: WeakKeyDictionary[
+		SpriteSheet, dict[int, tuple[AbstractImage, ...]]
+	] = WeakKeyDictionary()
+	"""Images of each sheet by starting index, shared by all buttons"""
+
+	event_types = [*_PushButton.event_types, 'on_half_click', 'on_full_click']
+	"""Events of button (own list, so registering doesn't add to PushButton's)"""
+
+	# Cache parent setters once instead of looking them up on every set
+	_FSET_X = _PushButton.x.fset  # type: ignore[attr-defined]
+	_FSET_Y = _PushButton.y.fset  # type: ignore[attr-defined]
 
 	def __init__(
 		self,
@@ -103,6 +138,8 @@ class Button(_PushButton, Widget):
 			kwargs (Callable):
 				Event handlers (name=func)
 		"""
+		self._init_anchor()
+
 		# Extract images from sheet
 		self._parse_sheet(image_sheet, image_start)
 
@@ -123,16 +160,19 @@ class Button(_PushButton, Widget):
 
 		self.ID = ID
 		self.window = window
-		self.status = 'Unpressed'
 
 		# Adds event handler for mouse events
 		if attach_events:
 			self._bind_mouse()
 
 		# Adds any event handlers passed through kwargs
+		# 	Skip registered names, as registering again only adds duplicates
 		for name in kwargs:
-			self.register_event_type(name)
-		self.push_handlers(**kwargs)
+			if name not in self.event_types:
+				self.register_event_type(name)
+		# Don't push an empty level to the handler stack if there are none
+		if kwargs:
+			self.push_handlers(**kwargs)
 
 	def update_sheet(self, image_sheet: SpriteSheet, image_start: str | int) -> None:
 		"""Update the sheet of the button."""
@@ -146,81 +186,100 @@ class Button(_PushButton, Widget):
 			if isinstance(image_start, str)
 			else image_start
 		)
-		self.unpressed_img, self.hover_img, self.pressed_img = image_sheet[
-			start : start + 3
-		]  # type: ignore[misc]
+		# Reuse images of other buttons made from the same part of the sheet
+		sheet_images = Button._sheet_images.setdefault(image_sheet, {})
+		if (images := sheet_images.get(start)) is None:
+			images = sheet_images[start] = tuple(image_sheet[start : start + 3])  # type: ignore[arg-type]
+		self.unpressed_img, self.hover_img, self.pressed_img = images
 
 	def _update_status(self, x: int, y: int) -> None:
 		# Update the status of the button given mouse position
+		prev = self._status
 
 		if self.value:
-			if self.dispatch and self.status != 'Pressed':
+			if self.dispatch and prev is not ButtonStatus.PRESSED:
 				self.dispatch_event('on_half_click', self)
-			self.status = 'Pressed'
+			self._status = ButtonStatus.PRESSED
 		elif self._check_hit(x, y):
-			if self.dispatch and self.status == 'Pressed':
+			if self.dispatch and prev is ButtonStatus.PRESSED:
 				self.dispatch_event('on_full_click', self)
-			self.status = 'Hover'
+			self._status = ButtonStatus.HOVER
 		else:
-			self.status = 'Unpressed'
+			self._status = ButtonStatus.UNPRESSED
+
+		# Group only needs to know about transitions
+		if self._hit_group is not None and self._status is not prev:
+			self._hit_group._update_active(self)
+
+	def _set_status(self, status: ButtonStatus) -> None:
+		# Set status directly, without dispatching (keeps group in sync)
+		self._status = status
+		if self._hit_group is not None:
+			self._hit_group._update_active(self)
+
+	def _get_mouse_pos(self) -> tuple[int, int]:
+		# Get last known mouse position.
+		# 	A group only sends events to some buttons, so it holds the latest one.
+		if self._hit_group is not None:
+			return self._hit_group.mouse_pos
+		return self._last_mouse_pos
+
+	def _sync_status(self) -> None:
+		# Sync status with last known mouse position
+		self._handle('on_mouse_motion', *self._get_mouse_pos(), 0, 0)
+
+	def _update_position(self) -> None:
+		super()._update_position()
+		# Bounds of group are now outdated
+		if self._hit_group is not None:
+			self._hit_group._dirty = True
 
 	def _calc_anchor(self) -> None:
 		prev_pos = self.pos
-		self._anchor = (
-			(
-				self.CONVERT_DYNAMIC[self.raw_anchor[0]] * self.hover_img.width
-				if isinstance(self.raw_anchor[0], str)
-				else self.raw_anchor[0]
-			),
-			(
-				self.CONVERT_DYNAMIC[self.raw_anchor[1]] * self.hover_img.height
-				if isinstance(self.raw_anchor[1], str)
-				else self.raw_anchor[1]
-			),
+		self._anchor = self._ax, self._ay = self._convert_anchor(
+			self.hover_img.width, self.hover_img.height
 		)
 		# Refresh position
 		self.pos = prev_pos
 
-	def _on_mouse_press(self, x: int, y: int, buttons: int, modifiers: int) -> bool:
+	def _handle(self, event: str, x: int, y: int, *args: int) -> bool:
+		# Handle any mouse event, given the name of its handler
 		if not self.enabled:
 			return False
 		self._last_mouse_pos = x, y
-		super().on_mouse_press(x, y, buttons, modifiers)
+
+		if event == 'on_mouse_motion':
+			# Mouse stayed on the same side of the button edges: nothing would change.
+			# 	Checking the image as well keeps it in sync if `.value` was set manually.
+			hit = self._check_hit(x, y)
+			if (
+				not self._pressed
+				and self._status
+				is (ButtonStatus.HOVER if hit else ButtonStatus.UNPRESSED)
+				and self._sprite.image
+				is (self._hover_img if hit else self._unpressed_img)
+			):
+				return hit
+
+		_PUSH_HANDLERS[event](self, x, y, *args)
 		self._update_status(x, y)
 
 		# Check for successful hit: Do not allow click to propagate through handlers
-		return self.status == 'Pressed'
+		return self._status is _HIT_STATUS[event]
 
-	def _on_mouse_motion(self, x: int, y: int, dx: int, dy: int) -> bool:
-		if not self.enabled:
-			return False
-		self._last_mouse_pos = x, y
-		super().on_mouse_motion(x, y, dx, dy)
-		self._update_status(x, y)
+	def _on_mouse_press(self, x: int, y: int, buttons: int, modifiers: int) -> bool:
+		return self._handle('on_mouse_press', x, y, buttons, modifiers)
 
-		# Check for successful hit: Do not allow click to propagate through handlers
-		return self.status == 'Hover'
+	def _on_mouse_motion(self, x: int, y: int, dx: int, dy: int) -> bool:
+		return self._handle('on_mouse_motion', x, y, dx, dy)
 
 	def _on_mouse_release(self, x: int, y: int, buttons: int, modifiers: int) -> bool:
-		if not self.enabled:
-			return False
-		self._last_mouse_pos = x, y
-		super().on_mouse_release(x, y, buttons, modifiers)
-		self._update_status(x, y)
-
-		return False
+		return self._handle('on_mouse_release', x, y, buttons, modifiers)
 
 	def _on_mouse_drag(
 		self, x: int, y: int, dx: int, dy: int, buttons: int, modifiers: int
 	) -> bool:
-		if not self.enabled:
-			return False
-		self._last_mouse_pos = x, y
-		super().on_mouse_drag(x, y, dx, dy, buttons, modifiers)
-		self._update_status(x, y)
-
-		# Check for successful hit: Do not allow click to propagate through handlers
-		return self.status == 'Hover'
+		return self._handle('on_mouse_drag', x, y, dx, dy, buttons, modifiers)
 
 	def enable(self) -> None:  # noqa: D102
 		self.enabled = True
@@ -234,13 +293,13 @@ class Button(_PushButton, Widget):
 
 		To set both `.x` and `.y`, use `.pos`.
 		"""
-		return self._x + self._anchor[0]
+		return self._x + self._ax
 
 	@x.setter
 	def x(self, val: float) -> None:
-		_PushButton.x.fset(self, val - self._anchor[0])  # type: ignore[attr-defined]
+		Button._FSET_X(self, val - self._ax)
 		# Sync status
-		self._on_mouse_motion(*self._last_mouse_pos, 0, 0)
+		self._sync_status()
 
 	@property  # type: ignore[override]
 	def y(self) -> float:
@@ -248,24 +307,24 @@ class Button(_PushButton, Widget):
 
 		To set both `.x` and `.y`, use `.pos`.
 		"""
-		return self._y + self._anchor[1]
+		return self._y + self._ay
 
 	@y.setter
 	def y(self, val: float) -> None:
-		_PushButton.y.fset(self, val - self._anchor[1])  # type: ignore[attr-defined]
+		Button._FSET_Y(self, val - self._ay)
 		# Sync status
-		self._on_mouse_motion(*self._last_mouse_pos, 0, 0)
+		self._sync_status()
 
 	@property
 	def pos(self) -> Point2D:
 		"""The anchor position."""
-		return self._x + self._anchor[0], self._y + self._anchor[1]
+		return self._x + self._ax, self._y + self._ay
 
 	@pos.setter
 	def pos(self, val: Point2D) -> None:
-		self.position = val[0] - self._anchor[0], val[1] - self._anchor[1]  # type: ignore[assignment] # bro widget can take float
+		self.position = val[0] - self._ax, val[1] - self._ay  # type: ignore[assignment] # bro widget can take float
 		# Sync status
-		self._on_mouse_motion(*self._last_mouse_pos, 0, 0)
+		self._sync_status()
 
 	@property
 	def anchor_x(self) -> float:
@@ -275,14 +334,14 @@ class Button(_PushButton, Widget):
 
 		To set both `.anchor_x` and `.anchor_y`, use `.anchor_pos`
 		"""
-		return self._anchor[0]
+		return self._ax
 
 	@anchor_x.setter
 	def anchor_x(self, val: AnchorX) -> None:
-		self.raw_anchor = val, self._anchor[1]
+		self.raw_anchor = val, self._ay
 		self._calc_anchor()
 		# Sync status
-		self._on_mouse_motion(*self._last_mouse_pos, 0, 0)
+		self._sync_status()
 
 	@property
 	def anchor_y(self) -> float:
@@ -292,14 +351,14 @@ class Button(_PushButton, Widget):
 
 		To set both `.anchor_x` and `.anchor_y`, use `.anchor_pos`
 		"""
-		return self._anchor[1]
+		return self._ay
 
 	@anchor_y.setter
 	def anchor_y(self, val: AnchorY) -> None:
-		self.raw_anchor = self._anchor[0], val
+		self.raw_anchor = self._ax, val
 		self._calc_anchor()
 		# Sync status
-		self._on_mouse_motion(*self._last_mouse_pos, 0, 0)
+		self._sync_status()
 
 	@property
 	def anchor(self) -> Point2D:
@@ -314,7 +373,7 @@ class Button(_PushButton, Widget):
 		self.raw_anchor = val
 		self._calc_anchor()
 		# Sync status
-		self._on_mouse_motion(*self._last_mouse_pos, 0, 0)
+		self._sync_status()
 
 	@property
 	def width(self) -> int:  # noqa: D102
@@ -323,3 +382,27 @@ class Button(_PushButton, Widget):
 	@property
 	def height(self) -> int:  # noqa: D102
 		return self.hover_img.height
+
+	@property
+	def status(self) -> ButtonStatus:
+		"""Status of button.
+
+		Can also be set with the string names ('Unpressed', 'Hover', 'Pressed').
+
+		Raises:
+			ValueError: Set to a value that is not a status or status name
+		"""
+		return self._status
+
+	@status.setter
+	def status(self, val: ButtonStatus | str) -> None:
+		try:
+			status = (
+				ButtonStatus[val.upper()] if isinstance(val, str) else ButtonStatus(val)
+			)
+		except (KeyError, ValueError):
+			raise ValueError(
+				f'Invalid status {val!r}. Must be one of: '
+				+ ', '.join(str(status) for status in ButtonStatus)
+			) from None
+		self._set_status(status)
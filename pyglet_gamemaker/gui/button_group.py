@@ -0,0 +1,255 @@
+"""Module holding ButtonGroup class.
+
+Use `~pgm.gui.ButtonGroup` instead of `~pgm.gui.button_group.ButtonGroup`
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary, WeakSet, ref
+
+from pyglet.gui import PushButton as _PushButton
+
+from ..shapes.hitbox_group import overlap_indices
+from ..types import ButtonStatus
+
+if TYPE_CHECKING:
+	from pyglet.window import Window as PygletWin
+
+	from .button import Button
+	from .text_button import TextButton
+
+
+class ButtonGroup:
+	"""Handles mouse events of many buttons with a single set of window handlers.
+
+	Normally, every button attaches its own handlers, so each mouse event runs
+	the full handler of every button. A group instead hit tests all of its buttons
+	in one pass and only sends the event to buttons that are hit or active
+	(hovered or pressed).
+
+	Groups are opt-in: create members with `attach_events=False` and add them with
+	`.add()`, or to a window's shared group (see `.shared()`).
+	Later members get events first, just like separately attached buttons.
+
+	Members are held weakly, so deleted widgets leave the group on their own.
+	Use `.remove()` to stop sending events to a widget that is still in use.
+	"""
+
+	_shared: WeakKeyDictionary[PygletWin, ButtonGroup] = WeakKeyDictionary()
+	"""The shared group of each window"""
+
+	window: PygletWin
+	"""Window group is attached to"""
+	mouse_pos: tuple[int, int] = 0, 0
+	"""The last mouse position registered by group"""
+
+	_widgets: list[ref[Button | TextButton]]
+	"""Reference to each widget, in order added"""
+	_buttons: list[ref[Button]]
+	"""Reference to button of each widget (TextButtons hold their own)"""
+	_lefts: list[float]
+	_bottoms: list[float]
+	_rights: list[float]
+	_tops: list[float]
+	_index: WeakKeyDictionary[Button, int]
+	"""Index of each button in `._widgets`"""
+	_active: WeakSet[Button]
+	"""Buttons that are currently hovered or pressed"""
+	_dirty: bool = True
+	"""If True, a member moved or was deleted and the bounds lists must be rebuilt"""
+
+	def __init__(
+		self,
+		window: PygletWin,
+		*widgets: Button | TextButton,
+		attach_events: bool = True,
+	) -> None:
+		"""Create a button group.
+
+		Args:
+			window (PygletWin):
+				Window for attaching self
+			*widgets (Button | TextButton):
+				Starting members of the group
+			attach_events (bool, optional):
+				If False, don't attach mouse events to window.
+				Event handlers can still be manually invoked.
+				Defaults to True.
+		"""
+		self.window = window
+		self._widgets = []
+		self._buttons = []
+		self._lefts, self._bottoms, self._rights, self._tops = [], [], [], []
+		self._index = WeakKeyDictionary()
+		self._active = WeakSet()
+
+		for widget in widgets:
+			self.add(widget)
+
+		if attach_events:
+			self.window.push_handlers(
+				on_mouse_press=self._on_mouse_press,
+				on_mouse_release=self._on_mouse_release,
+				on_mouse_motion=self._on_mouse_motion,
+				on_mouse_drag=self._on_mouse_drag,
+			)
+
+	@classmethod
+	def shared(cls, window: PygletWin) -> ButtonGroup:
+		"""Get the group shared by a window.
+
+		Created on first use.
+
+		Args:
+			window (PygletWin):
+				Window of the group
+
+		Returns:
+			ButtonGroup: The shared group
+		"""
+		if (group := cls._shared.get(window)) is None:
+			group = cls._shared[window] = cls(window)
+		return group
+
+	@property
+	def widgets(self) -> list[Button | TextButton]:
+		"""All live widgets in the group, in order added."""
+		if self._dirty:
+			self._update_bounds()
+		return [
+			widget
+			for widget_ref in self._widgets
+			if (widget := widget_ref()) is not None
+		]
+
+	def add(self, widget: Button | TextButton) -> None:
+		"""Add a widget to the group.
+
+		Args:
+			widget (Button | TextButton):
+				Widget to add. Should be created with `attach_events=False`.
+		"""
+		button = widget if isinstance(widget, _PushButton) else widget.button
+		button._hit_group = self
+
+		self._index[button] = len(self._widgets)
+		self._widgets.append(ref(widget, self._on_collect))
+		self._buttons.append(ref(button, self._on_collect))
+		self._dirty = True
+		self._update_active(button)
+
+	def remove(self, widget: Button | TextButton) -> None:
+		"""Remove a widget from the group.
+
+		Args:
+			widget (Button | TextButton):
+				Widget to remove
+
+		Raises:
+			ValueError: *widget* is not in the group
+		"""
+		for i, widget_ref in enumerate(self._widgets):
+			if widget_ref() is widget:
+				break
+		else:
+			raise ValueError(f'{widget!r} is not in group')
+
+		del self._widgets[i]
+		if (button := self._buttons.pop(i)()) is not None:
+			button._hit_group = None
+			self._active.discard(button)
+		self._dirty = True
+
+	def hit_index(self, x: float, y: float) -> int:
+		"""Get the index of the topmost (last added) widget hit by a point.
+
+		Args:
+			x (float):
+				x position of point
+			y (float):
+				y position of point
+
+		Returns:
+			int: The index in `.widgets`, or -1 if none are hit
+		"""
+		hits = self._hit_indices(x, y)
+		return hits[-1] if hits else -1
+
+	def _hit_indices(self, x: float, y: float) -> list[int]:
+		if self._dirty:
+			self._update_bounds()
+		# Point as a box with no size, using the same exclusive bounds as pyglet
+		return overlap_indices(
+			(x, y, x, y),
+			self._lefts,
+			self._bottoms,
+			self._rights,
+			self._tops,
+			inclusive=False,
+		)
+
+	def _on_collect(self, _: ref[Any]) -> None:
+		# A member was deleted: drop it on the next rebuild
+		self._dirty = True
+
+	def _update_bounds(self) -> None:
+		# Rebuild the bounds lists from the members, dropping deleted ones
+		members = [
+			(widget_ref, button_ref, button)
+			for widget_ref, button_ref in zip(self._widgets, self._buttons)
+			if widget_ref() is not None and (button := button_ref()) is not None
+		]
+		self._widgets = [member[0] for member in members]
+		self._buttons = [member[1] for member in members]
+		buttons = [member[2] for member in members]
+
+		# Indices shifted
+		self._index = WeakKeyDictionary((button, i) for i, button in enumerate(buttons))
+		self._active = WeakSet(
+			button for button in self._active if button in self._index
+		)
+
+		self._lefts = [button._x for button in buttons]
+		self._bottoms = [button._y for button in buttons]
+		self._rights = [button._x + button._width for button in buttons]
+		self._tops = [button._y + button._height for button in buttons]
+		self._dirty = False
+
+	def _update_active(self, button: Button) -> None:
+		# Track button if hovered or pressed (called whenever its status updates)
+		if button._status is not ButtonStatus.UNPRESSED or button.value:
+			self._active.add(button)
+		else:
+			self._active.discard(button)
+
+	def _dispatch(self, name: str, x: int, y: int, *args: Any) -> bool:
+		# Send event to widgets that are hit or active.
+		# 	Others would just stay unpressed, so they are skipped.
+		self.mouse_pos = x, y
+
+		targets = set(self._hit_indices(x, y))
+		targets.update(self._index[button] for button in self._active)
+
+		widgets = self._widgets
+		for i in sorted(targets, reverse=True):
+			# Do not allow event to propagate to widgets below
+			widget = widgets[i]()
+			if widget is not None and widget._handle(name, x, y, *args):
+				return True
+
+		return False
+
+	def _on_mouse_press(self, x: int, y: int, buttons: int, modifiers: int) -> bool:
+		return self._dispatch('on_mouse_press', x, y, buttons, modifiers)
+
+	def _on_mouse_motion(self, x: int, y: int, dx: int, dy: int) -> bool:
+		return self._dispatch('on_mouse_motion', x, y, dx, dy)
+
+	def _on_mouse_release(self, x: int, y: int, buttons: int, modifiers: int) -> bool:
+		return self._dispatch('on_mouse_release', x, y, buttons, modifiers)
+
+	def _on_mouse_drag(
+		self, x: int, y: int, dx: int, dy: int, buttons: int, modifiers: int
+	) -> bool:
+		return self._dispatch('on_mouse_drag', x, y, dx, dy, buttons, modifiers)
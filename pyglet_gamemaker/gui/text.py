@@ -9,12 +9,14 @@ from typing import TYPE_CHECKING
 
 from pyglet.text import Label
 
-from ..types import Anchor, AnchorX, AnchorY, Color, FontInfo, Point2D
+from ..types import Color
 from .widget import Widget
 
 if TYPE_CHECKING:
 	from pyglet.graphics import Batch, Group
 
+	from ..types import Anchor, AnchorX, AnchorY, FontInfo, Point2D
+
 
 class Text(Label, Widget):
 	"""A 2D label with scrolling and custom anchor support. Supports anchoring with specific pixel values or dynamic.
@@ -68,6 +70,8 @@ class Text(Label, Widget):
 				Color of text.
 				Defaults to Color.WHITE.
 		"""
+		self._init_anchor()
+
 		super().__init__(
 			text,
 			x,
@@ -75,7 +79,7 @@ class Text(Label, Widget):
 			0,
 			font_name=font_info[0],
 			font_size=font_info[1],
-			color=color.value,
+			color=color,
 			batch=batch,
 			group=group,
 		)
@@ -83,27 +87,15 @@ class Text(Label, Widget):
 		self.start_anchor = self.anchor = anchor
 		self.start_pos = self.pos = x, y
 		self.font_info = font_info
-		self.text = text
+		# Label already laid out the text, so only store it
+		self._text = text
 
 	def reset(self) -> None:  # noqa: D102
 		super().reset()
 		self.font_name, self.font_size = self.font_info  # type: ignore[assignment]
 
 	def _calc_anchor(self) -> None:
-		self._anchor = (
-			(
-				# Convert if AnchorX, else use raw int value
-				self.CONVERT_DYNAMIC[self.raw_anchor[0]] * self.content_width
-				if isinstance(self.raw_anchor[0], str)
-				else self.raw_anchor[0]
-			),
-			(
-				# Convert if AnchorY, else use raw int value
-				self.CONVERT_DYNAMIC[self.raw_anchor[1]] * self.content_height
-				if isinstance(self.raw_anchor[1], str)
-				else self.raw_anchor[1]
-			),
-		)
+		self._anchor = self._convert_anchor(self.content_width, self.content_height)
 		# Refresh position
 		self.pos = self.pos
 
@@ -118,7 +110,13 @@ class Text(Label, Widget):
 
 	@text.setter
 	def text(self, txt: str | int) -> None:
-		self.document.text = self._text = str(txt)
+		# Skip conversion in the common case of already being a str
+		txt = txt if type(txt) is str else str(txt)
+		# Skip expensive re-layout of text if unchanged (ex. updated every frame)
+		if txt == self._text:
+			return
+
+		self.document.text = self._text = txt
 		self._calc_anchor()
 
 	@property
@@ -155,10 +153,11 @@ class Text(Label, Widget):
 	@pos.setter
 	def pos(self, val: Point2D) -> None:
 		self._pos = val
+		ax, ay = self._anchor
 		self._set_position(
 			(
-				val[0] - self._anchor[0],
-				val[1] - self._anchor[1] - self._descent,  # Fixes y not centering
+				val[0] - ax,
+				val[1] - ay - self._descent,  # Fixes y not centering
 				self._z,
 			)
 		)
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from ..types import Color
+from ..types import ButtonStatus, Color
 from .button import Button
 from .text import Text
 from .widget import Widget
@@ -20,7 +20,6 @@ if TYPE_CHECKING:
 		Anchor,
 		AnchorX,
 		AnchorY,
-		ButtonStatus,
 		EventHandler,
 		FontInfo,
 		Point2D,
@@ -38,16 +37,30 @@ class TextButton(Widget):
 	Use kwargs to attach event handlers.
 	"""
 
-	_hover_enlarge: int = 0
+	__slots__ = (
+		'button',
+		'_text',
+		'_text_args',
+		'start_hover_enlarge',
+		'_hover_enlarge',
+		'_enlarged',
+		'window',
+		'attach_events',
+		'__weakref__',
+	)
+
+	_hover_enlarge: int
 
 	button: Button
 	"""Button object"""
-	text: Text
-	"""Text object"""
+	_text: Text | None
+	"""Text object, or None if not created yet (see `.text`)"""
+	_text_args: tuple[float, float, Batch, Group, Anchor, FontInfo, Color]
+	"""Arguments for creating text object when first needed"""
 	start_hover_enlarge: int
 	"""Starting hover enlarge value"""
 
-	_enlarged: bool = False
+	_enlarged: bool
 	"""If true, text is currently enlarged. Used internally to enlarge text once."""
 
 	def __init__(
@@ -119,6 +132,8 @@ class TextButton(Widget):
 			**kwargs (Callable[... Any]):
 				Any event handlers to attach to *button* (such as `on_full_click`)
 		"""
+		self._init_anchor()
+
 		self.button = Button(
 			ID,
 			x,
@@ -133,18 +148,12 @@ class TextButton(Widget):
 			attach_events=False,
 			**kwargs,
 		)
+		self._enlarged = False
 		self.start_hover_enlarge = self.hover_enlarge = hover_enlarge
 
-		self.text = Text(
-			text,
-			x,
-			y,
-			batch,
-			text_group,
-			text_anchor,
-			font_info,
-			color,
-		)
+		# Empty text (ex. icon buttons) is only created when first needed
+		self._text_args = x, y, batch, text_group, text_anchor, font_info, color
+		self._text = Text(text, *self._text_args) if text else None
 
 		self.window = window
 		self.attach_events = attach_events
@@ -153,90 +162,78 @@ class TextButton(Widget):
 			self._bind_mouse()
 
 	def reset(self) -> None:  # noqa: D102
-		self.text.reset()
+		if self._text is not None:
+			self._text.reset()
 		self.button.reset()
 		self.hover_enlarge = self.start_hover_enlarge
 		# Sync status
-		self._on_mouse_motion(*self.button._last_mouse_pos, 0, 0)
+		self._handle('on_mouse_motion', *self.button._get_mouse_pos(), 0, 0)
 
 	def _calc_anchor(self) -> None:
 		self.button._calc_anchor()
 
 	def _enlarge(self) -> None:
 		# Enlarge the text based on button status
-
-		if self.button.status == 'Hover':
-			# First frame hover: enlarge text
-			if not self._enlarged:
-				self._enlarged = True
-				prev = self.text.width, self.text.height
-				self.text.font_size += self._hover_enlarge
-				self._sync_text_anchor(prev)
-		else:
-			# First frame unhover: unenlarge text
-			if self._enlarged:
-				self._enlarged = False
-				prev = self.text.width, self.text.height
-				self.text.font_size -= self._hover_enlarge
-				self._sync_text_anchor(prev)
+		hovered = self.button._status is ButtonStatus.HOVER
+
+		# Only resize on the first frame of hover/unhover
+		if hovered is self._enlarged:
+			return
+		self._enlarged = hovered
+		# Status can change without the image (ex. release over unpressed button)
+		self.button._sync_status()
+
+		# Resizing by 0 does nothing, so don't create text for it
+		if self._text is None and not self._hover_enlarge:
+			return
+		text = self.text
+		prev = text.width, text.height
+		text.font_size += self._hover_enlarge if hovered else -self._hover_enlarge
+		self._sync_text_anchor(prev)
 
 	def _sync_text_anchor(self, prev: tuple[int, int]) -> None:
 		# Sync anchor of text widget using dimensions before resize
 
 		# Only sync if dynamic anchor
 		# Use _anchor to circumvent auto setting of raw_anchor to static
-
-		if isinstance(self.text.raw_anchor[0], str):
-			self.text._anchor = (
-				self.text.anchor_x + (self.text.width - prev[0]) / 2,
-				self.text.anchor_y,
-			)
-			# Refresh position
-			self.button.pos = self.button.pos
-			self.text.pos = self.text.pos
-
-		if isinstance(self.text.raw_anchor[1], str):
-			self.text._anchor = (
-				self.text.anchor_x,
-				self.text.anchor_y + (self.text.height - prev[1]) / 2,
-			)
-			# Refresh position
-			self.button.pos = self.button.pos
-			self.text.pos = self.text.pos
-
-	def _on_mouse_press(self, x: int, y: int, buttons: int, modifiers: int) -> bool:
-		if not self.button.enabled:
+		text = self.text
+		raw_x, raw_y = text.raw_anchor
+		dynamic_x, dynamic_y = isinstance(raw_x, str), isinstance(raw_y, str)
+		if not (dynamic_x or dynamic_y):
+			return
+
+		ax, ay = text._anchor
+		text._anchor = (
+			ax + (text.width - prev[0]) / 2 if dynamic_x else ax,
+			ay + (text.height - prev[1]) / 2 if dynamic_y else ay,
+		)
+		# Refresh position once for both axes.
+		# 	Only the label moves: button position does not depend on text anchor.
+		text.pos = text.pos
+
+	def _handle(self, event: str, x: int, y: int, *args: int) -> bool:
+		# Handle any mouse event, given the name of its handler
+		button = self.button
+		if not button.enabled:
 			return False
-		ret = self.button._on_mouse_press(x, y, buttons, modifiers)
+		ret = button._handle(event, x, y, *args)
 		self._enlarge()
 
 		return ret
 
-	def _on_mouse_motion(self, x: int, y: int, dx: int, dy: int) -> bool:
-		if not self.button.enabled:
-			return False
-		ret = self.button._on_mouse_motion(x, y, dx, dy)
-		self._enlarge()
+	def _on_mouse_press(self, x: int, y: int, buttons: int, modifiers: int) -> bool:
+		return self._handle('on_mouse_press', x, y, buttons, modifiers)
 
-		return ret
+	def _on_mouse_motion(self, x: int, y: int, dx: int, dy: int) -> bool:
+		return self._handle('on_mouse_motion', x, y, dx, dy)
 
 	def _on_mouse_release(self, x: int, y: int, buttons: int, modifiers: int) -> bool:
-		if not self.button.enabled:
-			return False
-		ret = self.button._on_mouse_release(x, y, buttons, modifiers)
-		self._enlarge()
-
-		return ret
+		return self._handle('on_mouse_release', x, y, buttons, modifiers)
 
 	def _on_mouse_drag(
 		self, x: int, y: int, dx: int, dy: int, buttons: int, modifiers: int
 	) -> bool:
-		if not self.button.enabled:
-			return False
-		ret = self.button._on_mouse_drag(x, y, dx, dy, buttons, modifiers)
-		self._enlarge()
-		
-		return ret
+		return self._handle('on_mouse_drag', x, y, dx, dy, buttons, modifiers)
 
 	def enable(self) -> None:  # noqa: D102
 		self.button.enable()
@@ -254,7 +251,9 @@ class TextButton(Widget):
 
 	@x.setter
 	def x(self, val: float) -> None:
-		self.button.x = self.text.x = val
+		self.button.x = val
+		if self._text is not None:
+			self._text.x = val
 		self._enlarge()
 
 	@property
@@ -267,7 +266,9 @@ class TextButton(Widget):
 
 	@y.setter
 	def y(self, val: float) -> None:
-		self.button.y = self.text.y = val
+		self.button.y = val
+		if self._text is not None:
+			self._text.y = val
 		self._enlarge()
 
 	@property
@@ -277,7 +278,9 @@ class TextButton(Widget):
 
 	@pos.setter
 	def pos(self, val: Point2D) -> None:
-		self.button.pos = self.text.pos = val
+		self.button.pos = val
+		if self._text is not None:
+			self._text.pos = val
 		self._enlarge()
 
 	@property
@@ -297,17 +300,16 @@ class TextButton(Widget):
 		# Just overwrite anchor if dynamic
 		# 	If static, use _anchor to circumvent auto setting of
 		# 	possible dynamic raw_anchor to static
+		text = self.text
 		if isinstance(val, str):
-			self.text.anchor_x = val
+			text.anchor_x = val
 		else:
-			self.text._anchor = val, self.text.anchor_y
+			text._anchor = val, text.anchor_y
 
 		# Subtract half of width diff between items (because text centered in button)
 		# 	to correct for different sized text
-		self.text._anchor = (
-			self.text.anchor_x - (self.button.width - self.text.width) / 2,
-			self.text.anchor_y,
-		)
+		ax, ay = text._anchor
+		text._anchor = ax - (self.button.width - text.width) / 2, ay
 		# Refresh position
 		self.pos = self.pos
 
@@ -330,17 +332,16 @@ class TextButton(Widget):
 		# Just overwrite anchor if dynamic
 		# 	If static, use _anchor to circumvent auto setting of
 		# 	possible dynamic raw_anchor to static
+		text = self.text
 		if isinstance(val, str):
-			self.text.anchor_y = val
+			text.anchor_y = val
 		else:
-			self.text._anchor = self.text.anchor_x, val
+			text._anchor = text.anchor_x, val
 
 		# Subtract half of height diff between items (because text centered in button)
 		# 	to correct for different sized text
-		self.text._anchor = (
-			self.text.anchor_x,
-			self.text.anchor_y - (self.button.height - self.text.height) / 2,
-		)
+		ax, ay = text._anchor
+		text._anchor = ax, ay - (self.button.height - text.height) / 2
 		# Refresh position
 		self.pos = self.pos
 
@@ -358,13 +359,25 @@ class TextButton(Widget):
 	def anchor(self, val: Anchor) -> None:
 		self.anchor_x, self.anchor_y = val
 
+	@property
+	def text(self) -> Text:
+		"""Text object.
+
+		If the button was created with empty text, it is created on first access.
+		"""
+		if self._text is None:
+			self._text = Text('', *self._text_args)
+			# Catch up with any moves made before text existed
+			self._text.pos = self.button.pos
+		return self._text
+
 	@property
 	def status(self) -> ButtonStatus:
 		"""Status of button. See `~pgm.gui.button.Button`."""
 		return self.button.status
 
 	@status.setter
-	def status(self, val: ButtonStatus) -> None:
+	def status(self, val: ButtonStatus | str) -> None:
 		self.button.status = val
 
 	@property
@@ -380,10 +393,10 @@ class TextButton(Widget):
 			# 	This way, no copy pasting code needed.
 			# 	Because status is being manually set instead of in Button._update_status,
 			# 	no dispatches are made.
-			self.button.status = 'Unpressed'
+			self.button._set_status(ButtonStatus.UNPRESSED)
 			self._enlarge()
 			self._hover_enlarge = size
-			self.button.status = 'Hover'
+			self.button._set_status(ButtonStatus.HOVER)
 			self._enlarge()
 
 		else:
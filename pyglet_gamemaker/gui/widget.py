@@ -6,12 +6,37 @@ Use `~pgm.gui.Widget` instead of `~pgm.gui.widget.Widget`.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
 	from ..types import Anchor, AnchorX, AnchorY, Point2D
 	from ..window import Window
 
+_ANCHOR_TAG: Final[dict[str, int]] = {
+	'left': 0,
+	'bottom': 0,
+	'center': 1,
+	'right': 2,
+	'top': 2,
+}
+"""Converts dynamic anchor to index of `_ANCHOR_MULT`"""
+_ANCHOR_MULT: Final = 0, 0.5, 1
+"""Multiplier of each dynamic anchor tag"""
+_STATIC: Final = -1
+"""Tag of a static (px) anchor"""
+_ANCHOR_PAIR_TAG: Final[dict[Anchor, tuple[int, int]]] = {
+	('left', 'bottom'): (0, 0),
+	('left', 'center'): (0, 1),
+	('left', 'top'): (0, 2),
+	('center', 'bottom'): (1, 0),
+	('center', 'center'): (1, 1),
+	('center', 'top'): (1, 2),
+	('right', 'bottom'): (2, 0),
+	('right', 'center'): (2, 1),
+	('right', 'top'): (2, 2),
+}
+"""Tags of every fully dynamic anchor, so common anchors take one lookup"""
+
 
 class Widget(ABC):
 	"""The base class for a Widget.
@@ -32,6 +57,10 @@ class Widget(ABC):
 		- Mouse events to attach when creating widget.
 	"""
 
+	# Only the anchor state is stored by Widget itself.
+	# 	Lets fully slotted subclasses (ex. TextButton) skip the instance dict.
+	__slots__ = ('_anchor', '_raw_anchor', '_anchor_tag')
+
 	CONVERT_DYNAMIC: dict[AnchorX | AnchorY, float] = {
 		'left': 0,
 		'bottom': 0,
@@ -39,15 +68,19 @@ class Widget(ABC):
 		'right': 1,
 		'top': 1,
 	}
-	"""Converts dynamic anchor to multiplier"""
+	"""Converts dynamic anchor to multiplier.
+
+	Deprecated: no longer used internally, kept for existing readers.
+	"""
 
-	_anchor: Point2D = 0, 0
+	_anchor: Point2D
 	"""Internally holds anchor offset of widget"""
+	_raw_anchor: Anchor
+	_anchor_tag: tuple[int, int]
+	"""Tags of `.raw_anchor` (index of `_ANCHOR_MULT`, or `_STATIC`)"""
 
 	window: Window
 	"""Window widget is associated with."""
-	raw_anchor: Anchor = 0, 0
-	"""Holds the raw anchor position (static + dynamic) of widget"""
 	start_pos: Point2D = 0, 0
 	"""Original (*unanchored* AND *unrotated*) position of widget"""
 	start_anchor: Anchor = 0, 0
@@ -57,10 +90,17 @@ class Widget(ABC):
 	attach_events: bool = True
 	"""If False, don't attach events to window"""
 
+	def _init_anchor(self) -> None:
+		# Slots have no class defaults, so subclasses call this first in `__init__`
+		# 	to start with a static (0, 0) anchor like before
+		self._anchor = 0, 0
+		self.raw_anchor = 0, 0
+
 	def offset(self, val: Point2D) -> None:  # noqa: D102
 		"""Add offset to widget."""
-		self.x += val[0]
-		self.y += val[1]
+		# Set both at once so position is only updated once
+		x, y = self.pos
+		self.pos = x + val[0], y + val[1]
 
 	def set_offset(self, val: Point2D) -> None:  # noqa: D102
 		"""Set the offset of widget."""
@@ -71,6 +111,33 @@ class Widget(ABC):
 		self.pos = self.start_pos
 		self.anchor = self.start_anchor
 
+	@property
+	def raw_anchor(self) -> Anchor:
+		"""The raw anchor position (static + dynamic) of widget."""
+		return self._raw_anchor
+
+	@raw_anchor.setter
+	def raw_anchor(self, val: Anchor) -> None:
+		# Convert dynamic anchors to tags once here instead of on every anchor calculation
+		# 	Fully dynamic anchors (the common case) are converted with one lookup
+		self._raw_anchor = val
+		tags = _ANCHOR_PAIR_TAG.get(val) if type(val) is tuple else None
+		if tags is None:
+			tags = (
+				_ANCHOR_TAG[val[0]] if isinstance(val[0], str) else _STATIC,
+				_ANCHOR_TAG[val[1]] if isinstance(val[1], str) else _STATIC,
+			)
+		self._anchor_tag = tags
+
+	def _convert_anchor(self, width: float, height: float) -> Point2D:
+		"""Convert `.raw_anchor` to px using widget dimensions."""
+		tag_x, tag_y = self._anchor_tag
+		raw_x, raw_y = self._raw_anchor
+		return (
+			_ANCHOR_MULT[tag_x] * width if tag_x != _STATIC else raw_x,  # type: ignore[return-value]
+			_ANCHOR_MULT[tag_y] * height if tag_y != _STATIC else raw_y,
+		)
+
 	def _bind_mouse(self) -> None:
 		self.window.push_handlers(
 			on_mouse_press=self._on_mouse_press,
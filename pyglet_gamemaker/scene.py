@@ -130,8 +130,12 @@ class Scene(ABC, EventDispatcher):
 		"""
 		for name, handler in kwargs.items():
 			self.event_handlers[name] = handler
-			self.register_event_type(name)
-		self.push_handlers(**kwargs)
+			# Registering is per class, so only the first scene needs to
+			if name not in getattr(self, 'event_types', ()):
+				self.register_event_type(name)
+		# Don't push an empty level to the handler stack if there are none
+		if kwargs:
+			self.push_handlers(**kwargs)
 
 	def remove_event_handlers(self, *args: str) -> None:
 		"""Remove event handlers from this scene.
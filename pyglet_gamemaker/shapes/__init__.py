@@ -1,2 +1,4 @@
 from .hitbox import Hitbox, HitboxRender, HitboxCircle, HitboxRenderCircle
-from .rect import Rect
\ No newline at end of file
+from .rect import Rect
+from .hitbox_group import HitboxGroup
+from .quadtree import Quadtree
\ No newline at end of file
@@ -6,14 +6,20 @@ Use `~pgm.shapes.{class}` instead of `~pgm.shapes.hitbox.{class}`
 from __future__ import annotations
 
 import math
-from typing import Literal, Self
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, Self
 
-import pyglet
 from pyglet.graphics import Batch, Group
 from pyglet.math import Vec2
 from pyglet.shapes import Circle, Polygon
 
-from ..types import Axis, Color, Point2D
+from ..types import Color, Point2D
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+
+	from .hitbox_group import HitboxGroup
+	from .quadtree import Quadtree
 
 
 class Hitbox:
@@ -28,18 +34,46 @@ class Hitbox:
 	- anchored: Shifting global position to account for anchor position of hitbox
 	"""
 
-	_local_coords: tuple[Point2D, ...] = tuple()
+	# Hitboxes are created in large numbers and their attributes are read on every
+	# 	move and collision, so they skip the instance dict.
+	# 	Slots can't have class defaults, so every one is set in `__init__`
+	__slots__ = (
+		'_local_coords',
+		'_raw_coords',
+		'_rotation_amount',
+		'_local_axes',
+		'_anchor',
+		'_angle',
+		'_rotation',
+		'_edges',
+		'_axes',
+		'_aabb',
+		'_obb',
+		'coords',
+		'_trans_pos',
+		'subtype',
+	)
+
+	_local_coords: tuple[Point2D, ...]
 	"""Holds the *untransformed* coords relative to first coordinate"""
-	_raw_coords: tuple[Point2D, ...] = tuple()
+	_raw_coords: tuple[Point2D, ...]
 	"""Holds the *unrotated* AND *unanchored*, but *translated/global* coords"""
-	_unanchored_coords: tuple[Point2D, ...] = tuple()
-	"""Holds the *unanchored*, *translated/global* coords"""
-	_anchor_coords: tuple[Point2D, ...] = tuple()
-	"""Holds the *untransformed* coords relative to anchor pos"""
-	_rotation_amount: tuple[Point2D, ...] = tuple()
+	_rotation_amount: tuple[Point2D, ...]
 	"""Holds the translation due to rotation of each point"""
-	_anchor: Point2D = 0, 0
-	_angle: float = 0
+	_local_axes: list[Vec2]
+	"""Holds the normal axes of `._local_coords` (unrotated)"""
+	_anchor: Point2D
+	_angle: float
+	_rotation: tuple[float, float]
+	"""Holds the cos and sin of `.angle`"""
+	_edges: list[Vec2] | None
+	"""Holds the vector along each edge of `.coords`, or None if they need recalculating"""
+	_axes: list[Vec2] | None
+	"""Holds the normal axes of `.coords`, or None if they need recalculating"""
+	_aabb: tuple[float, float, float, float] | None
+	"""Holds the bounding box of `.coords`, or None if it needs recalculating"""
+	_obb: tuple[float, float, float, float, float, float] | None
+	"""Holds the center and half sides of a rect, or None if they need recalculating"""
 
 	coords: tuple[Point2D, ...]
 	"""The final coordinates of the hitbox"""
@@ -72,11 +106,26 @@ class Hitbox:
 				f'Hitbox needs at least 2 coordinates ({len(coords)} passed).'
 			)
 
+		# Copy as tuples, like `._calc_coords()`, so caller's coords aren't shared
+		coords = tuple((x, y) for x, y in coords)
 		self._trans_pos = coords[0]
 		self._raw_coords = coords
-		self.anchor = anchor_pos
+		self._angle = 0
+		self._calc_local_coords()
 		self.subtype = _subtype
 
+		# New hitboxes aren't rotated, so without an anchor the final coords are
+		# 	just the given coords, and `._calc_coords()` can be skipped
+		# 	(circles store their center differently, so they always calculate)
+		if anchor_pos == (0, 0) and _subtype != 'circle':
+			self._anchor = anchor_pos
+			self._rotation = 1.0, 0.0
+			self._rotation_amount = ((0.0, 0.0),) * len(coords)
+			self._edges = self._axes = self._aabb = self._obb = None
+			self.coords = coords
+		else:
+			self.anchor = anchor_pos
+
 	@classmethod
 	def from_rect(
 		cls, x: float, y: float, width: float, height: float, anchor_pos: Point2D
@@ -101,90 +150,125 @@ class Hitbox:
 			_subtype='rect',
 		)
 
-	def _get_axes(self, remove_dupes: bool) -> list[Vec2]:
-		# Get the normal axes of the hitbox as Vec2 (for SAT).
-
-		axes = []
+	def _get_edges(self) -> list[Vec2]:
+		# Get the vector from each vertex to the next one (wrapping around).
+		# 	Shared by SAT axes and circle collision.
+		# 	Edges only change with coords, so they are cached until the next `._calc_coords()`
 
-		# Loops through vertices and gets all adjacent pairs
-		for i in range(
-			len(self.coords) // (2 if remove_dupes and self.subtype == 'rect' else 1)
-		):
-			# Grabbing vertex positions
-			p1, p2 = self.coords[i], self.coords[(i + 1) % len(self.coords)]
-
-			# Calculates the vector between them
-			vec = p1[0] - p2[0], p1[1] - p2[1]
-			# Gets perpendicular vector and normalizes it
-			# Normalizing helps get MTV
-			axes.append(Vec2(-vec[1], vec[0]).normalize())
+		if (edges := self._edges) is None:
+			coords = self.coords
+			edges = self._edges = [
+				Vec2(p2[0] - p1[0], p2[1] - p1[1])
+				for p1, p2 in zip(coords, coords[1:] + coords[:1])
+			]
+		return edges
 
+	def _get_axes(self, remove_dupes: bool) -> list[Vec2]:
+		# Get the normal axes of the hitbox as Vec2 (for SAT).
+		# 	Axes only change with coords, so they are cached until the next `._calc_coords()`
+
+		if (axes := self._axes) is None:
+			# Moving doesn't change axes, so the unrotated axes only need rotating
+			# 	Rotating keeps them normalized
+			if not self.angle:
+				axes = self._axes = self._local_axes[:]
+			else:
+				cos, sin = self._rotation
+				axes = self._axes = [
+					Vec2(x * cos - y * sin, x * sin + y * cos)
+					for x, y in self._local_axes
+				]
+
+		# Opposite sides of a rect are parallel, so half of the axes are duplicates
+		if remove_dupes and self.subtype == 'rect':
+			return axes[: len(axes) // 2]
 		return axes
 
 	def _project(self, axis: Vec2) -> tuple[float, float]:
 		# Project the hitbox onto an axis (use self._get_axes()) (for SAT).
 		# 	Returns a line
 
-		# Stores the left (minimum) and right (maximum) of line
-		maximum = minimum = axis.dot(Vec2(*self.coords[0]))
-
-		# Gets projections for each vertice
+		# Gets projections (dot product) for each vertice in a single pass
 		# Vertice with lowest and highest projections are used in line
-		for i in range(1, len(self.coords)):
-			# Projection using dot product
-			pos = axis.dot(Vec2(*self.coords[i]))
-			maximum = max(maximum, pos)
-			minimum = min(minimum, pos)
+		# 	For hitbox-sized lists, one in-place sort is faster than separate min() and max() calls
+		ax, ay = axis
+		projections = [ax * x + ay * y for x, y in self.coords]
+		projections.sort()
 
-		return minimum, maximum
+		return projections[0], projections[-1]
 
-	@staticmethod
-	def _intersect(l1: tuple[float, float], l2: tuple[float, float]) -> bool:
-		# Check if two lines intersect (for SAT).
+	def _project_obb(self, axis: Vec2) -> tuple[float, float]:
+		# Project a rect onto an axis (for SAT).
+		# 	Center is projected, then extended by both half sides projected
+		# 	Gives the same line as `._project()` for any rect (or parallelogram)
+		center_x, center_y, side1_x, side1_y, side2_x, side2_y = self._get_obb()
+		ax, ay = axis
 
-		# Left of line1 inside line2
-		if l2[0] <= l1[0] < l2[1]:
-			return True
+		center = ax * center_x + ay * center_y
+		extent = abs(ax * side1_x + ay * side1_y) + abs(ax * side2_x + ay * side2_y)
+		return center - extent, center + extent
 
-		# Right of line1 inside line2
-		if l2[0] < l1[1] <= l2[1]:
-			return True
+	@staticmethod
+	def _project_aabb(
+		aabb: tuple[float, float, float, float], axis: Vec2
+	) -> tuple[float, float]:
+		# Project a bounding box onto an x or y axis (for SAT).
+		# 	Gives the same line as `._project()` for axis-aligned rects, without
+		# 	projecting every vertice
+		xmin, ymin, xmax, ymax = aabb
+		ax, ay = axis
+
+		if ay:
+			return (ymin, ymax) if ay > 0 else (-ymax, -ymin)
+		if ax:
+			return (xmin, xmax) if ax > 0 else (-xmax, -xmin)
+		# Axis of a 0 length edge
+		return 0, 0
 
-		# Line2 completely inside line1
-		if l1[0] < l2[0] and l1[1] > l2[1]:
-			return True
+	@staticmethod
+	def _overlap(l1: tuple[float, float], l2: tuple[float, float]) -> float | None:
+		# Get the signed length of intersection between 2 lines (for SAT).
+		# 	Returns None if they do not intersect.
+		# 	Checks intersection and length in one pass, using the same rules as before:
+		# 	- Left of line1 inside line2: push line1 right
+		# 	- Right of line1 inside line2: push line1 left
+		# 	- Line2 completely inside line1: push whichever way is shorter
+		left1, right1 = l1
+		left2, right2 = l2
+
+		if left2 <= left1:
+			# Left of line1 inside line2
+			if left1 < right2:
+				return right2 - left1
+			# Right of line1 inside line2 (only if line1 is a point on the end of line2)
+			if left2 < right1 <= right2:
+				return -(right1 - left2)
+			return None
+
+		# Right of line1 inside line2, or line2 completely inside line1
+		if right1 > left2:
+			# Finds which way is shorter
+			# 	(always pushing left if right of line1 is inside line2)
+			if right1 - left2 < right2 - left1:
+				return -(right1 - left2)
+			return right2 - left1
 
-		return False
+		return None
 
-	@staticmethod
+	@classmethod
+	def _intersect(cls, l1: tuple[float, float], l2: tuple[float, float]) -> bool:
+		# Check if two lines intersect (for SAT).
+		# 	Kept for existing callers, `.collide()` uses `._overlap()` directly
+		return cls._overlap(l1, l2) is not None
+
+	@classmethod
 	def _get_intersection_length(
-		l1: tuple[float, float], l2: tuple[float, float]
+		cls, l1: tuple[float, float], l2: tuple[float, float]
 	) -> float:
 		# Get the length of intersection between 2 lines (for SAT).
-
-		# Left of line1 inside line2
-		if l2[0] <= l1[0] < l2[1]:
-			return l2[1] - l1[0]
-
-		# Right of line1 inside line2
-		elif l2[0] < l1[1] <= l2[1]:
-			return -(l1[1] - l2[0])
-
-		# Line2 completely inside line1
-		elif l1[0] < l2[0] and l1[1] > l2[1]:
-			# Finds which way is shorter
-			if l1[1] - l2[0] < l2[1] - l1[0]:
-				return -(l1[1] - l2[0])
-			return l2[1] - l1[0]
-
+		# 	Kept for existing callers, `.collide()` uses `._overlap()` directly
 		#! Should only return 0 if no intersection, should never happen
-		return 0
-
-	@staticmethod
-	def _contains(l1: tuple[float, float], l2: tuple[float, float]) -> bool:
-		# Check if one of the lines in completely contained inside the other (for SAT).
-
-		return (l1[0] < l2[0] and l1[1] > l2[1]) or (l2[0] < l1[0] and l2[1] > l1[1])
+		return cls._overlap(l1, l2) or 0
 
 	def collide(
 		self,
@@ -211,6 +295,17 @@ class Hitbox:
 		if not isinstance(other, Hitbox):
 			other = other.hitbox
 
+		# Broad phase: Hitboxes can't collide if their bounding boxes don't overlap
+		xmin, ymin, xmax, ymax = self._get_aabb()
+		other_xmin, other_ymin, other_xmax, other_ymax = other._get_aabb()
+		if (
+			xmax < other_xmin
+			or other_xmax < xmin
+			or ymax < other_ymin
+			or other_ymax < ymin
+		):
+			return False, None
+
 		# Get special circle collision axis
 		if isinstance(self, HitboxCircle):
 			self._set_collision_axis(other)
@@ -222,24 +317,43 @@ class Hitbox:
 		other_axes = other._get_axes(sacrifice_MTV)
 
 		# These store the length and axis for the MTV
-		MTV_len = float('inf')
+		# 	(and the absolute length, so it isn't recomputed every axis)
+		MTV_len = MTV_abs = float('inf')
 		MTV_axis = Vec2(0, 0)
 
+		all_axes = axes + other_axes
+
+		# Bind methods once, as they are used for every axis
+		get_overlap = self._overlap
+		project: Callable[[Vec2], tuple[float, float]]
+		other_project: Callable[[Vec2], tuple[float, float]]
+		if self.subtype == other.subtype == 'rect' and all(
+			0 in axis for axis in all_axes
+		):
+			# Special case: axis-aligned rects only need their bounding boxes projected
+			project = partial(self._project_aabb, self._get_aabb())
+			other_project = partial(self._project_aabb, other._get_aabb())
+		else:
+			# Other rects are projected from their center and sides, without every vertice
+			project = self._project_obb if self.subtype == 'rect' else self._project
+			other_project = (
+				other._project_obb if other.subtype == 'rect' else other._project
+			)
+
 		# * Step 2: Project the shapes onto each axis
-		for axis in axes + other_axes:
-			l1 = self._project(axis)
-			l2 = other._project(axis)
+		for axis in all_axes:
+			l1 = project(axis)
+			l2 = other_project(axis)
 
 			# * Step 3: Check for intersection
 			# * If the projections do not intersect, there cannot be a collision
-			if not self._intersect(l1, l2):
+			if (overlap := get_overlap(l1, l2)) is None:
 				return False, None
 
 			# * Step 4: For MTV - Get the smallest intersection length
 			# *	and store it along with the axis
-			overlap = self._get_intersection_length(l1, l2)
-			if abs(overlap) < abs(MTV_len):
-				MTV_len = overlap
+			if (overlap_abs := abs(overlap)) < MTV_abs:
+				MTV_len, MTV_abs = overlap, overlap_abs
 				MTV_axis = axis
 
 		return True, MTV_axis * MTV_len
@@ -262,67 +376,228 @@ class Hitbox:
 			tuple[Literal[False], None] | tuple[Literal[True], Vec2]: Whether
 				collision passed and MTV (None if no collision)
 		"""
+		xmin, ymin, xmax, ymax = self._get_aabb()
+
 		for rect in others:
-			if (collision_info := self.collide(rect, sacrifice_MTV))[0]:
+			# Get hitbox if not subclass
+			other = rect if isinstance(rect, Hitbox) else rect.hitbox
+
+			# Broad phase: Hitboxes can't collide if their bounding boxes don't overlap
+			other_xmin, other_ymin, other_xmax, other_ymax = other._get_aabb()
+			if (
+				xmax < other_xmin
+				or other_xmax < xmin
+				or ymax < other_ymin
+				or other_ymax < ymin
+			):
+				continue
+
+			if (collision_info := self.collide(other, sacrifice_MTV))[0]:
 				return collision_info
 
 		return False, None
 
-	def _calc_coords(self) -> None:
-		# Updates coordinates based on new position, angle, and/or anchor_pos.
+	def collide_quadtree(
+		self, quadtree: Quadtree, sacrifice_MTV: bool = False
+	) -> tuple[Literal[False], None] | tuple[Literal[True], Vec2]:
+		"""Run the SAT algorithm on the hitboxes of a quadtree near self.
 
-		# Steps:
-		# 1. Update local coords
-		# 2. Update anchor coords
-		# 3. Get displacement caused by rotation of anchor coords
-		# 4. Add translation to local to get raw
-		# 5. Add anchor rotation displacement to raw to get unanchored
-		# 6. Add anchor to unanchored to get final
-
-		# Use the raw coords, which are precalculated in __init__
-		# before first ._calc_coords call
-		self._local_coords = tuple(
+		Same as `.collide_any()`, but only hitboxes whose bounding boxes overlap
+		self's are checked, without looping over the rest.
+
+		Args:
+			quadtree (Quadtree):
+				Quadtree holding others to check collision with self.
+				Self is skipped if it is in the tree.
+			sacrifice_MTV (bool, optional):
+				If True, optimize speed in exchange for no MTV.
+				Defaults to False.
+
+		Returns:
+			tuple[Literal[False], None] | tuple[Literal[True], Vec2]: Whether
+				collision passed and MTV (None if no collision)
+		"""
+		return self.collide_any(quadtree.query(self), sacrifice_MTV)
+
+	def collide_group(
+		self, group: HitboxGroup, sacrifice_MTV: bool = False
+	) -> tuple[Literal[False], None] | tuple[Literal[True], Vec2]:
+		"""Run the SAT algorithm on the hitboxes of a group near self.
+
+		Same as `.collide_any()`, but the bounding boxes of the group are checked
+		in a single pass first.
+
+		Args:
+			group (HitboxGroup):
+				Group holding others to check collision with self.
+				Self is skipped if it is in the group.
+			sacrifice_MTV (bool, optional):
+				If True, optimize speed in exchange for no MTV.
+				Defaults to False.
+
+		Returns:
+			tuple[Literal[False], None] | tuple[Literal[True], Vec2]: Whether
+				collision passed and MTV (None if no collision)
+		"""
+		return self.collide_any(group.query(self), sacrifice_MTV)
+
+	@staticmethod
+	def sweep_and_prune(
+		hitboxes: list[Hitbox | HitboxRender | HitboxRenderCircle],
+	) -> list[
+		tuple[
+			Hitbox | HitboxRender | HitboxRenderCircle,
+			Hitbox | HitboxRender | HitboxRenderCircle,
+		]
+	]:
+		"""Find every pair of hitboxes whose bounding boxes overlap.
+
+		Use as a broad phase before `.collide()` when checking many hitboxes against
+		each other. Hitboxes are sorted by their left edge, so each one is only
+		compared with the ones it overlaps on the x-axis.
+
+		Args:
+			hitboxes (list[Hitbox | HitboxRender | HitboxRenderCircle]):
+				Hitboxes to check against each other
+
+		Returns:
+			list[tuple[Hitbox | HitboxRender | HitboxRenderCircle, Hitbox | HitboxRender | HitboxRenderCircle]]:
+				Pairs that may collide, each in the same order as in `hitboxes`
+		"""
+		# Index breaks ties in sorting, so objects are never compared
+		boxes = sorted(
 			(
-				coord[0] - self._raw_coords[0][0],
-				coord[1] - self._raw_coords[0][1],
+				(hitbox if isinstance(hitbox, Hitbox) else hitbox.hitbox)._get_aabb(),
+				i,
+				hitbox,
 			)
-			for coord in self._raw_coords
+			for i, hitbox in enumerate(hitboxes)
 		)
 
-		self._anchor_coords = tuple(
-			(coord[0] - self.anchor_x, coord[1] - self.anchor_y)
-			for coord in self._local_coords
+		pairs = []
+		active: list[tuple[tuple[float, float, float, float], int, Any]] = []
+		for box in boxes:
+			(xmin, ymin, _, ymax), i, hitbox = box
+
+			# Drop boxes that end before this one starts, as later ones start even further right
+			active = [other_box for other_box in active if not other_box[0][2] < xmin]
+
+			# Remaining boxes overlap on x, so only y needs checking
+			for (_, other_ymin, _, other_ymax), j, other in active:
+				if not (ymax < other_ymin or other_ymax < ymin):
+					pairs.append((other, hitbox) if j < i else (hitbox, other))
+
+			active.append(box)
+
+		return pairs
+
+	def _get_aabb(self) -> tuple[float, float, float, float]:
+		# Get the axis-aligned bounding box (xmin, ymin, xmax, ymax) of the hitbox.
+		# 	Cached until coords move (see `._calc_translation()`)
+		if (aabb := self._aabb) is None:
+			xs = [coord[0] for coord in self.coords]
+			ys = [coord[1] for coord in self.coords]
+			aabb = self._aabb = min(xs), min(ys), max(xs), max(ys)
+		return aabb
+
+	def _get_obb(self) -> tuple[float, float, float, float, float, float]:
+		# Get the center and half of 2 adjacent sides of a rect (for SAT).
+		# 	Cached until coords move, like bounding box
+		if (obb := self._obb) is None:
+			# Center is the middle of a diagonal
+			(x1, y1), _, (x3, y3), _ = self.coords
+			side1, side2 = self._get_edges()[:2]
+			obb = self._obb = (
+				(x1 + x3) / 2,
+				(y1 + y3) / 2,
+				side1.x / 2,
+				side1.y / 2,
+				side2.x / 2,
+				side2.y / 2,
+			)
+		return obb
+
+	def _calc_local_coords(self) -> None:
+		# Updates local coords and their normal axes from raw coords.
+		# 	Only needed when the shape itself changes (in __init__, or when
+		# 	raw coords are set directly), not when it moves or rotates
+		base_x, base_y = self._raw_coords[0]
+		local_coords = self._local_coords = tuple(
+			(coord[0] - base_x, coord[1] - base_y) for coord in self._raw_coords
 		)
 
+		# Gets the perpendicular vector of each edge and normalizes it
+		# 	Normalizing helps get MTV
+		self._local_axes = []
+		for p1, p2 in zip(local_coords, local_coords[1:] + local_coords[:1]):
+			x, y = -(p1[1] - p2[1]), p1[0] - p2[0]
+			# Normalized inline (0 length edges stay 0)
+			if length := math.sqrt(x * x + y * y):
+				x, y = x / length, y / length
+			self._local_axes.append(Vec2(x, y))
+
+	def _calc_coords(self) -> None:
+		# Updates coordinates based on new position, angle, and/or anchor_pos.
+
+		# Steps:
+		# 1. Get displacement caused by rotation of anchor coords
+		# 	(local coords relative to anchor pos)
+		# 2. Add translation to local to get raw
+		# 3. Add anchor rotation displacement to raw and anchor to get final
+		# Local coords are updated separately (see `._calc_local_coords()`)
+
+		# Coords are changing, so cached edges and axes are outdated
+		# 	(bounding box is reset in `._calc_translation()`)
+		self._edges = self._axes = None
+
+		# Most hitboxes never rotate, so unrotated ones skip the trig entirely
+		if not self.angle:
+			self._rotation = 1.0, 0.0
+			self._rotation_amount = ((0.0, 0.0),) * len(self._local_coords)
+			self._calc_translation()
+			return
+
+		# Angle is the same for every coord, so only calculate trig once
+		cos, sin = self._rotation = math.cos(self.angle), math.sin(self.angle)
+		anchor_x, anchor_y = self._anchor
+
+		# Anchor coords are only needed for rotation, so they are calculated
+		# 	in the same pass instead of being stored
 		self._rotation_amount = tuple(
-			(
-				self._get_rotated_pos(coord, 'x') - coord[0],
-				self._get_rotated_pos(coord, 'y') - coord[1],
+			(x * cos - y * sin - x, x * sin + y * cos - y)
+			for x, y in (
+				(coord[0] - anchor_x, coord[1] - anchor_y)
+				for coord in self._local_coords
 			)
-			for coord in self._anchor_coords
 		)
 
-		self._raw_coords = tuple(
-			(coord[0] + self._trans_pos[0], coord[1] + self._trans_pos[1])
-			for coord in self._local_coords
-		)
+		self._calc_translation()
 
-		self._unanchored_coords = tuple(
-			(coord[0] + rotation[0], coord[1] + rotation[1])
-			for coord, rotation in zip(self._raw_coords, self._rotation_amount)
-		)
+	def _calc_translation(self) -> None:
+		# Updates coordinates based on new position only (steps 2-3 of `._calc_coords()`).
+		# 	Local and rotation coords don't depend on position, so they are reused
+		# 	Edges and axes don't either, so they stay cached
 
-		self.coords = tuple(
-			(coord[0] - self.anchor_x, coord[1] - self.anchor_y)
-			for coord in self._unanchored_coords
-		)
+		# Bounding boxes move with coords
+		self._aabb = self._obb = None
 
-	def _get_rotated_pos(self, coord: Point2D, axis: Axis) -> float:
-		# Gets position of point if it were rotated
-		if axis == 'x':
-			return coord[0] * math.cos(self.angle) - coord[1] * math.sin(self.angle)
-		if axis == 'y':
-			return coord[0] * math.sin(self.angle) + coord[1] * math.cos(self.angle)
+		trans_x, trans_y = self._trans_pos
+		anchor_x, anchor_y = self._anchor
+
+		# Raw and final coords are built in the same pass over local coords
+		# 	(unanchored coords are only needed for final, so they aren't stored)
+		raw_coords: list[Point2D] = []
+		coords: list[Point2D] = []
+		for (x, y), (rotation_x, rotation_y) in zip(
+			self._local_coords, self._rotation_amount
+		):
+			x += trans_x
+			y += trans_y
+			raw_coords.append((x, y))
+			coords.append((x + rotation_x - anchor_x, y + rotation_y - anchor_y))
+
+		self._raw_coords = tuple(raw_coords)
+		self.coords = tuple(coords)
 
 	@property
 	def x(self) -> float:
@@ -334,8 +609,11 @@ class Hitbox:
 
 	@x.setter
 	def x(self, val: float) -> None:
+		# Unchanged position doesn't move coords
+		if val == self._trans_pos[0]:
+			return
 		self._trans_pos = val, self._trans_pos[1]
-		self._calc_coords()
+		self._calc_translation()
 
 	@property
 	def y(self) -> float:
@@ -347,8 +625,10 @@ class Hitbox:
 
 	@y.setter
 	def y(self, val: float) -> None:
+		if val == self._trans_pos[1]:
+			return
 		self._trans_pos = self._trans_pos[0], val
-		self._calc_coords()
+		self._calc_translation()
 
 	@property
 	def pos(self) -> Point2D:
@@ -357,8 +637,10 @@ class Hitbox:
 
 	@pos.setter
 	def pos(self, val: Point2D) -> None:
+		if val == self._trans_pos:
+			return
 		self._trans_pos = val
-		self._calc_coords()
+		self._calc_translation()
 
 	@property
 	def anchor_x(self) -> float:
@@ -413,8 +695,13 @@ class HitboxCircle(Hitbox):
 	Do not try to access `.coords` as they are not real coords.
 	"""
 
+	__slots__ = ('axis', 'radius')
+
 	axis: Vec2
-	"""The axis between the center and the closest point on last hitbox checked for collision."""
+	"""The axis between the center and the closest point on last hitbox checked for collision.
+
+	Only updated for hitboxes whose bounding boxes overlap the circle's.
+	"""
 	radius: float
 	"""The radius of the circle"""
 
@@ -439,22 +726,21 @@ class HitboxCircle(Hitbox):
 		self.radius = radius
 
 	def _get_axes(self, sacrifice_MTV: bool) -> list[Vec2]:
-		return [self.axis.normalize()]
+		# Normalized inline (same as `Vec2.normalize()`), as this runs every collision
+		x, y = axis = self.axis
+		if length := math.sqrt(x * x + y * y):
+			return [Vec2(x / length, y / length)]
+		return [axis]
 
 	def _project(self, axis: Vec2) -> tuple[float, float]:
-		proj = axis.dot(Vec2(*self.coords[0]))
+		# Dot product with center, without building a Vec2 for it
+		(ax, ay), (x, y) = axis, self.coords[0]
+		proj = ax * x + ay * y
 		return proj - self.radius, proj + self.radius
 
-	def collide_any(  # noqa: D102
-		self,
-		others: list[Hitbox | HitboxRender | HitboxRenderCircle],
-		sacrifice_MTV: bool = False,
-	) -> tuple[Literal[False], None] | tuple[Literal[True], Vec2]:
-		for rect in others:
-			if (collision_info := self.collide(rect, sacrifice_MTV))[0]:
-				return collision_info
-
-		return False, None
+	def _get_aabb(self) -> tuple[float, float, float, float]:
+		x, y = self.coords[0]
+		return x - self.radius, y - self.radius, x + self.radius, y + self.radius
 
 	def _set_collision_axis(
 		self, hitbox: Hitbox | HitboxRender | HitboxRenderCircle
@@ -469,13 +755,6 @@ class HitboxCircle(Hitbox):
 			tuple[Literal[False], None] | tuple[Literal[True], Vec2]: Whether
 				collision passed and MTV (None if no collision)
 		"""
-
-		def get_projection(v1: Vec2, v2: Vec2) -> Vec2:
-			# Clamping forces the projection to be within the 2 vertices of the polygon
-			# (or 2 endpoints of v2) by forcing scale factor to be from 0-1
-			# This facilitates finding closest points on polygon to circle center
-			return pyglet.math.clamp(v1.dot(v2) / v2.length_squared(), 0, 1) * v2
-
 		# Get hitbox if not subclass
 		if not isinstance(hitbox, Hitbox):
 			hitbox = hitbox.hitbox
@@ -484,69 +763,65 @@ class HitboxCircle(Hitbox):
 		# *	To calculate collision axis, use line between centers
 		if isinstance(hitbox, HitboxCircle):
 			# Get vector pointing from the center of circle #1 to...
-			self.axis = Vec2(
-				self.coords[0][0] - hitbox.coords[0][0],
-				self.coords[0][1] - hitbox.coords[0][1],
-			)
+			x = self.coords[0][0] - hitbox.coords[0][0]
+			y = self.coords[0][1] - hitbox.coords[0][1]
 			# ... the edge of circle #2
-			self.axis = self.axis.normalize() * (self.axis.length() - hitbox.radius)
+			# 	(normalized inline, so length is only calculated once)
+			length = math.sqrt(x * x + y * y)
+			if length:
+				x, y = x / length, y / length
+			self.axis = Vec2(x * (length - hitbox.radius), y * (length - hitbox.radius))
 			return
 
 		# Get closest point to other hitbox
-		least = Vec2(0, 0), float('inf')
-		for i in range(len(hitbox.coords)):
-			# Loop through each axis on polygon
-			# Grabbing vertex positions
-			p1, p2 = hitbox.coords[i], hitbox.coords[(i + 1) % len(hitbox.coords)]
-
-			# Calculates the vector between vertices
-			vec = Vec2(p2[0] - p1[0], p2[1] - p1[1])
-
+		# 	Works on plain floats instead of Vec2, as it runs for every edge
+		least = float('inf')
+		least_x = least_y = 0.0
+		center_x, center_y = self.coords[0]
+		# Loop through each edge on polygon (first vertex and vector to the next one)
+		for p1, (edge_x, edge_y) in zip(hitbox.coords, hitbox._get_edges()):
 			# Vector from vertex to center of circle
-			pre_proj = Vec2(self.coords[0][0] - p1[0], self.coords[0][1] - p1[1])
+			pre_x, pre_y = center_x - p1[0], center_y - p1[1]
+
+			# Scale factor of projection of that vector onto edge.
+			# 	Clamping forces the projection to be within the 2 vertices of the edge
+			# 	by forcing scale factor to be from 0-1
+			# 	This facilitates finding closest points on polygon to circle center
+			scale = (pre_x * edge_x + pre_y * edge_y) / (
+				edge_x * edge_x + edge_y * edge_y
+			)
+			if scale < 0:
+				scale = 0
+			elif scale > 1:
+				scale = 1
 
-			# Proj holds the vector from p1 to the closest point
-			# on the polygon to the circle center
-			proj = get_projection(pre_proj, vec)
-			# Subtracting pre_proj gives vector from circle center to closest point
-			diff = proj - pre_proj
+			# Subtracting vector from projection gives vector from circle center to closest point
+			diff_x, diff_y = scale * edge_x - pre_x, scale * edge_y - pre_y
 
-			# Update least
-			if (length := diff.length()) < least[1]:
-				least = diff, length
+			# Update least (squared length orders the same as length, without sqrt)
+			if (length_sq := diff_x * diff_x + diff_y * diff_y) < least:
+				least, least_x, least_y = length_sq, diff_x, diff_y
 
-		self.axis = least[0]
+		self.axis = Vec2(least_x, least_y)
 
 	def _calc_coords(self) -> None:
 		# Same algorithm as in Hitbox, but optimized for single center coordinate of circle
 		self._local_coords = ((0, 0),)
-		self._anchor_coords = ((-self.anchor_x, -self.anchor_y),)
-		self._rotation_amount = (
-			(
-				self._get_rotated_pos(self._anchor_coords[0], 'x')
-				- self._anchor_coords[0][0],
-				self._get_rotated_pos(self._anchor_coords[0], 'y')
-				- self._anchor_coords[0][1],
-			),
-		)
-		self._raw_coords = (self._trans_pos,)
-		self._unanchored_coords = (
-			(
-				self._raw_coords[0][0] + self._rotation_amount[0][0],
-				self._raw_coords[0][1] + self._rotation_amount[0][1],
-			),
-		)
-		self.coords = (
-			(
-				self._unanchored_coords[0][0] - self.anchor_x,
-				self._unanchored_coords[0][1] - self.anchor_y,
-			),
-		)
+		if not self.angle:
+			self._rotation = 1.0, 0.0
+			self._rotation_amount = ((0.0, 0.0),)
+		else:
+			cos, sin = self._rotation = math.cos(self.angle), math.sin(self.angle)
+			x, y = -self._anchor[0], -self._anchor[1]
+			self._rotation_amount = ((x * cos - y * sin - x, x * sin + y * cos - y),)
+		self._calc_translation()
 
 
 class HitboxRender:
 	"""Holds a Hitbox with `.hitbox` and `.render` objects."""
 
+	__slots__ = ('_hitbox_color', 'hitbox', 'render', 'subtype')
+
 	_hitbox_color: Color
 
 	hitbox: Hitbox
@@ -590,7 +865,7 @@ class HitboxRender:
 				The subtype of the hitbox. Ex: 'rect', 'circle'.
 				Defaults to None.
 		"""
-		self.render = Polygon(*coords, color=color.value, batch=batch, group=group)
+		self.render = Polygon(*coords, color=color, batch=batch, group=group)
 		self.hitbox = Hitbox(coords, anchor_pos, _subtype=subtype)
 
 		self.subtype = subtype
@@ -680,14 +955,68 @@ class HitboxRender:
 		"""
 		return self.hitbox.collide_any(others, sacrifice_MTV)
 
+	def collide_quadtree(
+		self, quadtree: Quadtree, sacrifice_MTV: bool = False
+	) -> tuple[Literal[False], None] | tuple[Literal[True], Vec2]:
+		"""Run the SAT algorithm on the hitboxes of a quadtree near self.
+
+		Same as `.collide_any()`, but only hitboxes whose bounding boxes overlap
+		self's are checked, without looping over the rest.
+
+		Args:
+			quadtree (Quadtree):
+				Quadtree holding others to check collision with self.
+				Self is skipped if it is in the tree.
+			sacrifice_MTV (bool, optional):
+				If True, optimize speed in exchange for no MTV.
+				Defaults to False.
+
+		Returns:
+			tuple[Literal[False], None] | tuple[Literal[True], Vec2]: Whether
+				collision passed and MTV (None if no collision)
+		"""
+		return self.hitbox.collide_quadtree(quadtree, sacrifice_MTV)
+
+	def collide_group(
+		self, group: HitboxGroup, sacrifice_MTV: bool = False
+	) -> tuple[Literal[False], None] | tuple[Literal[True], Vec2]:
+		"""Run the SAT algorithm on the hitboxes of a group near self.
+
+		Same as `.collide_any()`, but the bounding boxes of the group are checked
+		in a single pass first.
+
+		Args:
+			group (HitboxGroup):
+				Group holding others to check collision with self.
+				Self is skipped if it is in the group.
+			sacrifice_MTV (bool, optional):
+				If True, optimize speed in exchange for no MTV.
+				Defaults to False.
+
+		Returns:
+			tuple[Literal[False], None] | tuple[Literal[True], Vec2]: Whether
+				collision passed and MTV (None if no collision)
+		"""
+		return self.hitbox.collide_group(group, sacrifice_MTV)
+
 	def _calc_coords(self) -> None:
 		self.hitbox._calc_coords()
+		self._update_render()
 
+	def _calc_translation(self) -> None:
+		self.hitbox._calc_translation()
+
+		# Vertices of render are relative to its position, so moving doesn't change them.
+		# 	Only the translation is updated, without recalculating vertices
+		self.render._coordinates = self.hitbox.coords  # type: ignore[assignment]
+		self.render.position = self.hitbox.coords[0]
+
+	def _update_render(self) -> None:
 		# Update polygon render
 		self.render._coordinates = self.hitbox.coords  # type: ignore[assignment]
 		self.render._update_vertices()
-		self.render.x = self.hitbox.coords[0][0]
-		self.render.y = self.hitbox.coords[0][1]
+		# Both at once, so translation is only updated once
+		self.render.position = self.hitbox.coords[0]
 
 	@property
 	def x(self) -> float:
@@ -699,8 +1028,11 @@ class HitboxRender:
 
 	@x.setter
 	def x(self, val: float) -> None:
+		# Unchanged position doesn't move coords or render
+		if val == self.hitbox._trans_pos[0]:
+			return
 		self.hitbox._trans_pos = val, self.hitbox._trans_pos[1]
-		self._calc_coords()
+		self._calc_translation()
 
 	@property
 	def y(self) -> float:
@@ -712,8 +1044,10 @@ class HitboxRender:
 
 	@y.setter
 	def y(self, val: float) -> None:
+		if val == self.hitbox._trans_pos[1]:
+			return
 		self.hitbox._trans_pos = self.hitbox._trans_pos[0], val
-		self._calc_coords()
+		self._calc_translation()
 
 	@property
 	def pos(self) -> Point2D:
@@ -722,8 +1056,10 @@ class HitboxRender:
 
 	@pos.setter
 	def pos(self, val: Point2D) -> None:
+		if val == self.hitbox._trans_pos:
+			return
 		self.hitbox._trans_pos = val
-		self._calc_coords()
+		self._calc_translation()
 
 	@property
 	def anchor_x(self) -> float:
@@ -779,12 +1115,14 @@ class HitboxRender:
 	@hitbox_color.setter
 	def hitbox_color(self, val: Color) -> None:
 		self._hitbox_color = val
-		self.render.color = val.value
+		self.render.color = val
 
 
 class HitboxRenderCircle:
 	"""Holds a Circle Hitbox with `.hitbox` and `.render` objects."""
 
+	__slots__ = ('_hitbox_color', 'hitbox', 'render', 'subtype')
+
 	_hitbox_color: Color
 
 	hitbox: HitboxCircle
@@ -823,7 +1161,7 @@ class HitboxRenderCircle:
 				The anchor position.
 				Defaults to (0, 0).
 		"""
-		self.render = Circle(x, y, radius, color=color.value, batch=batch, group=group)
+		self.render = Circle(x, y, radius, color=color, batch=batch, group=group)
 		self.hitbox = HitboxCircle(x, y, radius, anchor_pos)
 
 		self.subtype = 'circle'
@@ -872,6 +1210,50 @@ class HitboxRenderCircle:
 		"""
 		return self.hitbox.collide_any(others, sacrifice_MTV)
 
+	def collide_quadtree(
+		self, quadtree: Quadtree, sacrifice_MTV: bool = False
+	) -> tuple[Literal[False], None] | tuple[Literal[True], Vec2]:
+		"""Run the SAT algorithm on the hitboxes of a quadtree near self.
+
+		Same as `.collide_any()`, but only hitboxes whose bounding boxes overlap
+		self's are checked, without looping over the rest.
+
+		Args:
+			quadtree (Quadtree):
+				Quadtree holding others to check collision with self.
+				Self is skipped if it is in the tree.
+			sacrifice_MTV (bool, optional):
+				If True, optimize speed in exchange for no MTV.
+				Defaults to False.
+
+		Returns:
+			tuple[Literal[False], None] | tuple[Literal[True], Vec2]: Whether
+				collision passed and MTV (None if no collision)
+		"""
+		return self.hitbox.collide_quadtree(quadtree, sacrifice_MTV)
+
+	def collide_group(
+		self, group: HitboxGroup, sacrifice_MTV: bool = False
+	) -> tuple[Literal[False], None] | tuple[Literal[True], Vec2]:
+		"""Run the SAT algorithm on the hitboxes of a group near self.
+
+		Same as `.collide_any()`, but the bounding boxes of the group are checked
+		in a single pass first.
+
+		Args:
+			group (HitboxGroup):
+				Group holding others to check collision with self.
+				Self is skipped if it is in the group.
+			sacrifice_MTV (bool, optional):
+				If True, optimize speed in exchange for no MTV.
+				Defaults to False.
+
+		Returns:
+			tuple[Literal[False], None] | tuple[Literal[True], Vec2]: Whether
+				collision passed and MTV (None if no collision)
+		"""
+		return self.hitbox.collide_group(group, sacrifice_MTV)
+
 	def _calc_coords(self) -> None:
 		self.hitbox._calc_coords()
 		self.render.position = self.hitbox.coords[0]
@@ -886,8 +1268,12 @@ class HitboxRenderCircle:
 
 	@x.setter
 	def x(self, val: float) -> None:
+		# Unchanged position doesn't move coords or render
+		if val == self.hitbox._trans_pos[0]:
+			return
+		# Hitbox setter already updates coords, so only render needs moving
 		self.hitbox.x = val
-		self._calc_coords()
+		self.render.position = self.hitbox.coords[0]
 
 	@property
 	def y(self) -> float:
@@ -899,8 +1285,10 @@ class HitboxRenderCircle:
 
 	@y.setter
 	def y(self, val: float) -> None:
+		if val == self.hitbox._trans_pos[1]:
+			return
 		self.hitbox.y = val
-		self._calc_coords()
+		self.render.position = self.hitbox.coords[0]
 
 	@property
 	def pos(self) -> Point2D:
@@ -909,8 +1297,10 @@ class HitboxRenderCircle:
 
 	@pos.setter
 	def pos(self, val: Point2D) -> None:
+		if val == self.hitbox._trans_pos:
+			return
 		self.hitbox.pos = val
-		self._calc_coords()
+		self.render.position = self.hitbox.coords[0]
 
 	@property
 	def anchor_x(self) -> float:
@@ -966,4 +1356,4 @@ class HitboxRenderCircle:
 	@hitbox_color.setter
 	def hitbox_color(self, val: Color) -> None:
 		self._hitbox_color = val
-		self.render.color = val.value
+		self.render.color = val
@@ -0,0 +1,172 @@
+"""Module holding HitboxGroup class.
+
+Use `~pgm.shapes.HitboxGroup` instead of `~pgm.shapes.hitbox_group.HitboxGroup`
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .hitbox import Hitbox
+
+if TYPE_CHECKING:
+	from .hitbox import HitboxRender, HitboxRenderCircle
+
+
+def overlap_indices(
+	box: tuple[float, float, float, float],
+	xmins: list[float],
+	ymins: list[float],
+	xmaxs: list[float],
+	ymaxs: list[float],
+	inclusive: bool = True,
+) -> list[int]:
+	"""Get the index of every bounding box overlapping another.
+
+	Boxes are given by their edges so no unpacking is needed per box.
+
+	Args:
+		box (tuple[float, float, float, float]):
+			Bounding box to check (xmin, ymin, xmax, ymax)
+		xmins (list[float]):
+			Left edge of each box
+		ymins (list[float]):
+			Bottom edge of each box
+		xmaxs (list[float]):
+			Right edge of each box
+		ymaxs (list[float]):
+			Top edge of each box
+		inclusive (bool, optional):
+			If True, boxes that only touch overlap, like
+			`~pgm.shapes.Hitbox.collide_any()`. If False, they don't, like
+			`~pyglet.gui.WidgetBase._check_hit` (with a point as *box*).
+			Defaults to True.
+
+	Returns:
+		list[int]: Indices of overlapping boxes, in ascending order
+	"""
+	xmin, ymin, xmax, ymax = box
+	if not inclusive:
+		return [
+			i
+			for i, (other_xmin, other_ymin, other_xmax, other_ymax) in enumerate(
+				zip(xmins, ymins, xmaxs, ymaxs)
+			)
+			if other_xmin < xmax
+			and xmin < other_xmax
+			and other_ymin < ymax
+			and ymin < other_ymax
+		]
+	return [
+		i
+		for i, (other_xmin, other_ymin, other_xmax, other_ymax) in enumerate(
+			zip(xmins, ymins, xmaxs, ymaxs)
+		)
+		if not (
+			xmax < other_xmin
+			or other_xmax < xmin
+			or ymax < other_ymin
+			or other_ymax < ymin
+		)
+	]
+
+
+class HitboxGroup:
+	"""Holds many hitboxes for broad phase collision checks.
+
+	The bounding boxes of members are stored as separate lists of edges, so
+	finding the members near a hitbox is one pass over plain floats instead of
+	a method call per member.
+
+	Bounding boxes are stored when members are added. If members move, call
+	`.update()` before checking collisions (ex. once per frame).
+
+	Use with `~pgm.shapes.Hitbox.collide_group()`.
+	"""
+
+	hitboxes: list[Hitbox | HitboxRender | HitboxRenderCircle]
+	"""All hitboxes in the group, in order added"""
+
+	_xmins: list[float]
+	_ymins: list[float]
+	_xmaxs: list[float]
+	_ymaxs: list[float]
+
+	def __init__(self, *hitboxes: Hitbox | HitboxRender | HitboxRenderCircle) -> None:
+		"""Create a hitbox group.
+
+		Args:
+			*hitboxes (Hitbox | HitboxRender | HitboxRenderCircle):
+				Starting members of the group
+		"""
+		self.hitboxes = list(hitboxes)
+		self.update()
+
+	def add(self, hitbox: Hitbox | HitboxRender | HitboxRenderCircle) -> None:
+		"""Add a hitbox to the group.
+
+		Args:
+			hitbox (Hitbox | HitboxRender | HitboxRenderCircle):
+				Hitbox to add
+		"""
+		xmin, ymin, xmax, ymax = (
+			hitbox if isinstance(hitbox, Hitbox) else hitbox.hitbox
+		)._get_aabb()
+
+		self.hitboxes.append(hitbox)
+		self._xmins.append(xmin)
+		self._ymins.append(ymin)
+		self._xmaxs.append(xmax)
+		self._ymaxs.append(ymax)
+
+	def remove(self, hitbox: Hitbox | HitboxRender | HitboxRenderCircle) -> None:
+		"""Remove a hitbox from the group.
+
+		Args:
+			hitbox (Hitbox | HitboxRender | HitboxRenderCircle):
+				Hitbox to remove
+		"""
+		i = self.hitboxes.index(hitbox)
+		del self.hitboxes[i]
+		del self._xmins[i], self._ymins[i], self._xmaxs[i], self._ymaxs[i]
+
+	def update(self) -> None:
+		"""Rebuild the bounding boxes of members after they move."""
+		boxes = [
+			(hitbox if isinstance(hitbox, Hitbox) else hitbox.hitbox)._get_aabb()
+			for hitbox in self.hitboxes
+		]
+		self._xmins = [box[0] for box in boxes]
+		self._ymins = [box[1] for box in boxes]
+		self._xmaxs = [box[2] for box in boxes]
+		self._ymaxs = [box[3] for box in boxes]
+
+	def query(
+		self, hitbox: Hitbox | HitboxRender | HitboxRenderCircle
+	) -> list[Hitbox | HitboxRender | HitboxRenderCircle]:
+		"""Get every member whose bounding box overlaps a hitbox's.
+
+		Args:
+			hitbox (Hitbox | HitboxRender | HitboxRenderCircle):
+				Hitbox to check. Not included in the result if it is a member.
+
+		Returns:
+			list[Hitbox | HitboxRender | HitboxRenderCircle]: Members that may
+				collide, in the order they were added
+		"""
+		target = hitbox if isinstance(hitbox, Hitbox) else hitbox.hitbox
+		hitboxes = self.hitboxes
+		return [
+			other
+			for other in (
+				hitboxes[i]
+				for i in overlap_indices(
+					target._get_aabb(),
+					self._xmins,
+					self._ymins,
+					self._xmaxs,
+					self._ymaxs,
+				)
+			)
+			if (other if isinstance(other, Hitbox) else other.hitbox) is not target
+		]
@@ -0,0 +1,218 @@
+"""Module holding Quadtree class.
+
+Use `~pgm.shapes.Quadtree` instead of `~pgm.shapes.quadtree.Quadtree`
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .hitbox import Hitbox
+
+if TYPE_CHECKING:
+	from .hitbox import HitboxRender, HitboxRenderCircle
+
+
+class Quadtree:
+	"""Spatial index of hitboxes for broad phase collision checks.
+
+	Each node covers a region of the world and splits into 4 quadrants once it holds
+	more than `.max_items` hitboxes. Queries only visit quadrants overlapping the
+	query, so hitboxes far away are never checked.
+
+	Hitboxes are stored by their bounding box when inserted. If they move,
+	`.clear()` the tree and insert them again (ex. once per frame).
+	Hitboxes outside of the tree's region are still found, but are never split up.
+
+	Use with `~pgm.shapes.Hitbox.collide_quadtree()`.
+	"""
+
+	max_items: int
+	"""Number of hitboxes a node holds before splitting"""
+	max_depth: int
+	"""Maximum number of splits from the root"""
+
+	bounds: tuple[float, float, float, float]
+	"""Region covered by node (xmin, ymin, xmax, ymax)"""
+	depth: int
+	"""Number of splits from the root"""
+	items: list[
+		tuple[
+			tuple[float, float, float, float],
+			int,
+			Hitbox | HitboxRender | HitboxRenderCircle,
+		]
+	]
+	"""Bounding box, insertion order, and hitbox of each item in node"""
+	children: list[Quadtree]
+	"""The 4 quadrants of node, or empty if not split"""
+	_count: int = 0
+	"""Number of hitboxes inserted (only tracked by root)"""
+
+	def __init__(
+		self,
+		x: float,
+		y: float,
+		width: float,
+		height: float,
+		max_items: int = 8,
+		max_depth: int = 8,
+		*,
+		_depth: int = 0,
+	) -> None:
+		"""Create a quadtree covering a rectangular region.
+
+		Args:
+			x (float):
+				x position of region
+			y (float):
+				y position of region
+			width (float):
+				Width of region
+			height (float):
+				Height of region
+			max_items (int, optional):
+				Number of hitboxes a node holds before splitting.
+				Defaults to 8.
+			max_depth (int, optional):
+				Maximum number of splits from the root.
+				Defaults to 8.
+			_depth (int, optional):
+				Number of splits from the root.
+				Defaults to 0.
+		"""
+		self.bounds = x, y, x + width, y + height
+		self.max_items, self.max_depth = max_items, max_depth
+		self.depth = _depth
+		self.items = []
+		self.children = []
+
+	def insert(self, hitbox: Hitbox | HitboxRender | HitboxRenderCircle) -> None:
+		"""Add a hitbox to the tree.
+
+		Args:
+			hitbox (Hitbox | HitboxRender | HitboxRenderCircle):
+				Hitbox to add
+		"""
+		box = (hitbox if isinstance(hitbox, Hitbox) else hitbox.hitbox)._get_aabb()
+		item = box, self._count, hitbox
+		self._count += 1
+
+		# Go down to the smallest quadrant that fully contains hitbox
+		node = self
+		while (child := node._quadrant(box)) is not None:
+			node = child
+
+		node.items.append(item)
+		if (
+			not node.children
+			and len(node.items) > node.max_items
+			and node.depth < node.max_depth
+		):
+			node._split()
+
+	def query(
+		self, hitbox: Hitbox | HitboxRender | HitboxRenderCircle
+	) -> list[Hitbox | HitboxRender | HitboxRenderCircle]:
+		"""Get every hitbox in the tree whose bounding box overlaps another's.
+
+		Args:
+			hitbox (Hitbox | HitboxRender | HitboxRenderCircle):
+				Hitbox to check. Not included in the result if it is in the tree.
+
+		Returns:
+			list[Hitbox | HitboxRender | HitboxRenderCircle]: Hitboxes that may
+				collide, in the order they were inserted
+		"""
+		target = hitbox if isinstance(hitbox, Hitbox) else hitbox.hitbox
+		xmin, ymin, xmax, ymax = target._get_aabb()
+
+		found: list[
+			tuple[
+				tuple[float, float, float, float],
+				int,
+				Hitbox | HitboxRender | HitboxRenderCircle,
+			]
+		] = []
+		nodes = [self]
+		while nodes:
+			node = nodes.pop()
+			found.extend(
+				item
+				for item in node.items
+				if not (
+					xmax < item[0][0]
+					or item[0][2] < xmin
+					or ymax < item[0][1]
+					or item[0][3] < ymin
+				)
+			)
+			# Only quadrants overlapping hitbox can hold hitboxes overlapping it
+			nodes.extend(
+				child
+				for child in node.children
+				if not (
+					xmax < child.bounds[0]
+					or child.bounds[2] < xmin
+					or ymax < child.bounds[1]
+					or child.bounds[3] < ymin
+				)
+			)
+
+		found.sort(key=lambda item: item[1])
+		return [
+			other
+			for _, _, other in found
+			if (other if isinstance(other, Hitbox) else other.hitbox) is not target
+		]
+
+	def clear(self) -> None:
+		"""Remove all hitboxes from the tree."""
+		self.items = []
+		self.children = []
+		self._count = 0
+
+	def _quadrant(self, box: tuple[float, float, float, float]) -> Quadtree | None:
+		# Get the quadrant fully containing a bounding box, if node is split.
+		# 	Boxes crossing the middle of node (or outside of it) stay in node
+		xmin, ymin, xmax, ymax = box
+		for child in self.children:
+			child_xmin, child_ymin, child_xmax, child_ymax = child.bounds
+			if (
+				child_xmin <= xmin
+				and xmax <= child_xmax
+				and child_ymin <= ymin
+				and ymax <= child_ymax
+			):
+				return child
+		return None
+
+	def _split(self) -> None:
+		# Create the 4 quadrants and move down every item that fits in one
+		xmin, ymin, xmax, ymax = self.bounds
+		width, height = (xmax - xmin) / 2, (ymax - ymin) / 2
+		self.children = [
+			Quadtree(
+				x,
+				y,
+				width,
+				height,
+				self.max_items,
+				self.max_depth,
+				_depth=self.depth + 1,
+			)
+			for y in (ymin, ymin + height)
+			for x in (xmin, xmin + width)
+		]
+
+		items, self.items = self.items, []
+		for item in items:
+			if (child := self._quadrant(item[0])) is None:
+				self.items.append(item)
+			else:
+				child.items.append(item)
+
+		# All items may have moved into the same quadrant
+		for child in self.children:
+			if len(child.items) > child.max_items and child.depth < child.max_depth:
+				child._split()
@@ -5,20 +5,31 @@ Use `~pgm.shapes.Rect` instead of `~pgm.shapes.rect.Rect`
 
 from __future__ import annotations
 
-from pyglet.graphics import Batch, Group
+from typing import TYPE_CHECKING
 
-from ..types import Color, Point2D
 from .hitbox import HitboxRender
 
+if TYPE_CHECKING:
+	from pyglet.graphics import Batch, Group
+
+	from ..types import Color, Point2D
+
 
 class Rect(HitboxRender):
 	"""A rendered rectangle.
 
-	Has attributes for each vertex position (`.bottomleft`, `.bottomright`, `.topright`, `.topleft`)
+	Has read-only attributes for each vertex position (`.bottomleft`, `.bottomright`, `.topright`, `.topleft`)
 
 	To create a rectangle without a render, use `~pgm.shapes.Hitbox.from_rect()`.
 	"""
 
+	__slots__ = ('_width', '_height')
+
+	_width: float
+	"""Internally holds width of rect, so it isn't recalculated from coords"""
+	_height: float
+	"""Internally holds height of rect, so it isn't recalculated from coords"""
+
 	def __init__(
 		self,
 		x: float,
@@ -59,6 +70,7 @@ class Rect(HitboxRender):
 			anchor_pos,
 			subtype='rect',
 		)
+		self._width, self._height = width, height
 
 	@property
 	def bottomleft(self) -> Point2D:
@@ -83,35 +95,44 @@ class Rect(HitboxRender):
 	@property
 	def width(self) -> float:
 		"""The width of *unrotated* rectangle."""
-		return self.hitbox._raw_coords[1][0] - self.hitbox._raw_coords[0][0]
+		return self._width
 
 	@width.setter
 	def width(self, val: float) -> None:
-		# Set raw coords instead of local coords because ._calc_coords
-		# updates local coords. Updates to local coords would
-		# get overwritten when calling ._calc_coords
-		self.hitbox._raw_coords = (
-			self.hitbox._raw_coords[0],
-			(self.hitbox._raw_coords[0][0] + val, self.hitbox._raw_coords[1][1]),
-			(self.hitbox._raw_coords[3][0] + val, self.hitbox._raw_coords[2][1]),
-			self.hitbox._raw_coords[3],
-		)
-		self._calc_coords()
+		self.resize(val, self._height)
 
 	@property
 	def height(self) -> float:
 		"""The height of *unrotated* rectangle."""
-		return self.hitbox._raw_coords[3][1] - self.hitbox._raw_coords[0][1]
+		return self._height
 
 	@height.setter
 	def height(self, val: float) -> None:
-		# Set raw coords instead of local coords because ._calc_coords
-		# updates local coords. Updates to local coords would
-		# get overwritten when calling ._calc_coords
-		self.hitbox._raw_coords = (
-			self.hitbox._raw_coords[0],
-			self.hitbox._raw_coords[1],
-			(self.hitbox._raw_coords[2][0], self.hitbox._raw_coords[1][1] + val),
-			(self.hitbox._raw_coords[3][0], self.hitbox._raw_coords[0][1] + val),
+		self.resize(self._width, val)
+
+	def resize(self, width: float, height: float) -> None:
+		"""Set both `.width` and `.height`, only updating coords once.
+
+		Args:
+			width (float):
+				New width of rect
+			height (float):
+				New height of rect
+		"""
+		# Unchanged size doesn't change coords
+		if width == self._width and height == self._height:
+			return
+		self._width, self._height = width, height
+
+		# Set raw coords instead of local coords, as local coords
+		# (and their axes) are calculated from raw coords
+		hitbox = self.hitbox
+		bottomleft, bottomright, _, topleft = hitbox._raw_coords
+		hitbox._raw_coords = (
+			bottomleft,
+			(bottomleft[0] + width, bottomright[1]),
+			(topleft[0] + width, bottomright[1] + height),
+			(topleft[0], bottomleft[1] + height),
 		)
+		hitbox._calc_local_coords()
 		self._calc_coords()
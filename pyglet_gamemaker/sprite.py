@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from weakref import WeakValueDictionary
 
 import pyglet
 from pyglet.image import ImageGrid, TextureGrid
@@ -13,6 +14,10 @@ if TYPE_CHECKING:
 	from pyglet.image import AbstractImage, TextureRegion
 
 
+_grids: WeakValueDictionary[tuple[str, int, int], TextureGrid] = WeakValueDictionary()
+"""Texture grid of each (file_path, rows, cols), shared by sheets while any use it"""
+
+
 class SpriteSheet:
 	"""An object holding a rectangular sheet of common sprites.
 
@@ -20,13 +25,34 @@ class SpriteSheet:
 	Allows indexing by name using `.name()`.
 	"""
 
+	# Weak references are kept, as buttons share images per sheet by weak key
+	__slots__ = (
+		'path',
+		'rows',
+		'cols',
+		'img',
+		'image_grid',
+		'grid',
+		'_regions',
+		'lookup',
+		'__weakref__',
+	)
+
+	path: str
+	"""The path to the sprite sheet"""
+	rows: int
+	"""The number of rows for sprites"""
+	cols: int
+	"""The number of columns for sprites"""
 	img: AbstractImage
 	"""Stores the original image"""
 	image_grid: ImageGrid
 	"""Stores the unoptimized image grid"""
 	grid: TextureGrid
 	"""Stores the optimized image grid (one actually rendered)"""
-	lookup: dict[str, int] = {}
+	_regions: tuple[TextureRegion, ...]
+	"""Stores each sprite of `.grid`, so indexing skips the grid's index checks"""
+	lookup: dict[str, int]
 	"""The lookup table to convert aliases to integers for indexing"""
 
 	def __init__(self, file_path: str, rows: int, cols: int) -> None:
@@ -38,11 +64,17 @@ class SpriteSheet:
 			cols (int): The number of columns for sprites
 		"""
 		self.path, self.rows, self.cols = file_path, rows, cols
-		self.img = pyglet.resource.image(file_path)  # Loads og img
+		self.lookup = {}
+		# Loads og img (pyglet.resource already reuses loaded images)
+		self.img = pyglet.resource.image(file_path)
 		self.image_grid = ImageGrid(self.img, rows, cols)  # Creates image grid
-		self.grid = TextureGrid(
-			self.image_grid
-		)  # For efficient rendering, make it all one texture
+
+		# For efficient rendering, make it all one texture.
+		# 	Sheets of the same file and layout share one, instead of rebuilding every region
+		if (grid := _grids.get((file_path, rows, cols))) is None:
+			grid = _grids[file_path, rows, cols] = TextureGrid(self.image_grid)
+		self.grid = grid
+		self._regions = tuple(grid)
 
 	def name(self, *args: str) -> None:
 		"""Name all of the grid parts instead of indexing with numbers.
@@ -70,12 +102,18 @@ class SpriteSheet:
 
 		Either a normal index or a string matching an index (using `.name()`) can be used.
 		"""
-		# Slice and int can be directly used
-		if isinstance(index, slice | int):
+		# Use lookup table if string (checked first, as names are the usual index)
+		if type(index) is str:
+			return self._regions[self.lookup[index]]
+		# Int can be directly used
+		if isinstance(index, int):
+			return self._regions[index]
+		# Slices are handled by grid
+		if isinstance(index, slice):
 			return self.grid[index]
-		# Use lookup table if string
+		# Names that are str subclasses
 		if isinstance(index, str):
-			return self.grid[self.lookup[index]]
+			return self._regions[self.lookup[index]]
 		raise ValueError(f'SpriteSheet[] recieved bad value: {index}')
 
 	@property
@@ -2,7 +2,7 @@
 
 - Point2D: (float, float) - for 2D points
 - FontInfo: (type, size)
-- ButtonStatus: A status for button widgets. See `~pgm.gui.button.Button`
+- ButtonStatus: Enum of statuses for button widgets. See `~pgm.types.ButtonStatus`
 - Axis: Either 'x' or 'y'
 - AnchorX: Dynamic or static anchor on x-axis
 - AnchorY: Dynamic or static anchor on y-axis
@@ -21,7 +21,6 @@ from pyglet.customtypes import AnchorY as _AnchorY
 
 Point2D = tuple[float, float]
 FontInfo = tuple[str | None, int | None]
-ButtonStatus = Literal['Unpressed', 'Hover', 'Pressed']
 Axis = Literal['x', 'y']
 AnchorX = _AnchorX | float
 AnchorY = _AnchorY | float
@@ -29,8 +28,38 @@ Anchor = tuple[AnchorX, AnchorY]
 EventHandler = Callable[..., Any]
 
 
-class Color(Enum):
-	"""A bunch of colors in the form (int, int, int, int)."""
+class ButtonStatus(Enum):
+	"""A status for button widgets. See `~pgm.gui.button.Button`.
+
+	Members are checked by identity so the per-event checks are cheap, but still
+	compare equal to (and hash and print as) the old string names 'Unpressed',
+	'Hover', and 'Pressed'.
+	"""
+
+	UNPRESSED = 0
+	HOVER = 1
+	PRESSED = 2
+
+	def __eq__(self, other: object) -> bool:
+		"""Compare by identity, or by name if `other` is a string."""
+		if isinstance(other, str):
+			return other == str(self)
+		return self is other
+
+	def __hash__(self) -> int:
+		"""Hash of old string name, matching `.__eq__`."""
+		return hash(str(self))
+
+	def __str__(self) -> str:
+		"""Old string name of status, e.g. 'Hover'."""
+		return self.name.capitalize()
+
+
+class Color(tuple[int, int, int, int], Enum):
+	"""A bunch of colors in the form (int, int, int, int).
+
+	Members are tuples themselves, so they can be passed to pyglet without `.value`.
+	"""
 
 	RED = 255, 0, 0, 255
 	ORANGE = 255, 167, 0, 255
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import importlib
+import traceback
+
 import pyglet
 
 # Holds all imports for tests
@@ -11,6 +14,8 @@ tests = [
 	'shapes_hitbox',
 	'shapes_rect',
 	'shapes_circle',
+	'shapes_quadtree',
+	'shapes_hitbox_group',
 	'scene',
 	'window',
 ]
@@ -20,4 +25,8 @@ pyglet.resource.reindex()
 
 for test_num, test in enumerate(tests, 1):
 	print(f'\n-----------------------------\nStarting test #{test_num}: "{test}"\n\n')
-	exec(f'import test.{test}')  # Run actual test
+	try:
+		importlib.import_module(f'test.{test}')  # Run actual test
+	except Exception:
+		# Keep running the other tests if one fails
+		traceback.print_exc()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import random
+
+import pyglet
+from pyglet.graphics import Batch, Group
+from pyglet.window import Window, key
+
+from pyglet_gamemaker.shapes import HitboxGroup, HitboxRender
+from pyglet_gamemaker.types import Color
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+group = Group()
+
+hitbox = HitboxRender.from_rect(100, 100, 60, 40, Color.WHITE, batch, group)
+hitbox_group = HitboxGroup(
+	*(
+		HitboxRender.from_rect(
+			random.uniform(0, 600),
+			random.uniform(0, 440),
+			30,
+			30,
+			Color.BLUE,
+			batch,
+			group,
+		)
+		for _ in range(20)
+	)
+)
+
+
+@window.event
+def on_mouse_motion(x, y, dx, dy):
+	hitbox.pos = x, y
+
+
+@window.event
+def on_key_press(symbol, modifiers):
+	if symbol == key.A:
+		# Add a box under the mouse
+		hitbox_group.add(
+			HitboxRender.from_rect(*hitbox.pos, 30, 30, Color.BLUE, batch, group)
+		)
+	elif symbol == key.R and hitbox_group.hitboxes:
+		# Remove the oldest box
+		box = hitbox_group.hitboxes[0]
+		hitbox_group.remove(box)
+		box.render.delete()
+	elif symbol == key.LEFT:
+		hitbox.angle -= 0.1
+	elif symbol == key.RIGHT:
+		hitbox.angle += 0.1
+
+
+def update(dt):
+	# Boxes drift, so update the group after moving them
+	for box in hitbox_group.hitboxes:
+		box.pos = (
+			(box.x + random.uniform(-1, 1)) % window.width,
+			(box.y + random.uniform(-1, 1)) % window.height,
+		)
+	hitbox_group.update()
+
+	# Boxes near the hitbox are yellow, others blue
+	nearby = hitbox_group.query(hitbox)
+	for box in hitbox_group.hitboxes:
+		box.render.color = Color.YELLOW if box in nearby else Color.BLUE
+
+	collided = hitbox.collide_group(hitbox_group)[0]
+	# Group should give the same result as checking every box
+	assert collided == hitbox.collide_any(hitbox_group.hitboxes)[0]
+	hitbox.render.opacity = 128 if collided else 255
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.clock.schedule_interval(update, 1 / 60)
+pyglet.app.run()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import random
+
+import pyglet
+from pyglet.graphics import Batch, Group
+from pyglet.window import Window, key
+
+from pyglet_gamemaker.shapes import HitboxRender, Quadtree
+from pyglet_gamemaker.types import Color
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+group = Group()
+
+quadtree = Quadtree(0, 0, 640, 480, max_items=4)
+
+hitbox = HitboxRender.from_rect(100, 100, 60, 40, Color.WHITE, batch, group)
+boxes = [
+	HitboxRender.from_rect(
+		random.uniform(0, 600),
+		random.uniform(0, 440),
+		random.uniform(10, 40),
+		random.uniform(10, 40),
+		Color.BLUE,
+		batch,
+		group,
+	)
+	for _ in range(50)
+]
+velocities = [(random.uniform(-100, 100), random.uniform(-100, 100)) for _ in boxes]
+
+paused = False
+
+
+@window.event
+def on_mouse_motion(x, y, dx, dy):
+	hitbox.pos = x, y
+
+
+@window.event
+def on_key_press(symbol, modifiers):
+	global paused
+
+	if symbol == key.LEFT:
+		hitbox.angle -= 0.1
+	elif symbol == key.RIGHT:
+		hitbox.angle += 0.1
+	elif symbol == key.SPACE:
+		paused = not paused
+
+
+def update(dt):
+	if not paused:
+		for i, (box, (vx, vy)) in enumerate(zip(boxes, velocities)):
+			x, y = box.x + vx * dt, box.y + vy * dt
+			# Bounce off the edges of the window
+			if not 0 <= x <= window.width:
+				vx = -vx
+			if not 0 <= y <= window.height:
+				vy = -vy
+			velocities[i] = vx, vy
+			box.pos = x, y
+
+	# Boxes moved, so rebuild the tree
+	quadtree.clear()
+	for box in boxes:
+		quadtree.insert(box)
+
+	# Boxes near the hitbox are yellow, others blue
+	nearby = quadtree.query(hitbox)
+	for box in boxes:
+		box.render.color = Color.YELLOW if box in nearby else Color.BLUE
+
+	collided = hitbox.collide_quadtree(quadtree)[0]
+	# Tree should give the same result as checking every box
+	assert collided == hitbox.collide_any(boxes)[0]
+	hitbox.render.opacity = 128 if collided else 255
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.clock.schedule_interval(update, 1 / 60)
+pyglet.app.run()